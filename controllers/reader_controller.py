@@ -8,15 +8,17 @@ RASPBERRY PI OPTIMIZATIONS:
 - Configurable update intervals (100ms default)
 """
 
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QObject, QThreadPool, QTimer, QSocketNotifier, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QFileDialog
 from datetime import datetime
 import threading
-from collections import deque
+import itertools
+import queue
 import sys
+import time
 
-from models import ReaderModel, SensorDirection, RXInventoryTag
-from utils import SerialManager, ConnectionParams, ExcelExporter, ReaderProtocol
+from models import ReaderModel, SensorDirection, RXInventoryTag, TagEvent
+from utils import SerialManager, ConnectionParams, ExcelExporter, ExportWorker, ReaderProtocol, FrameParser
 
 # =============================================================================
 # RASPBERRY PI UI OPTIMIZATION CONSTANTS
@@ -36,9 +38,39 @@ elif IS_LINUX:
 else:
     UI_UPDATE_INTERVAL_MS = 50   # Windows/Mac: 20 times/second
 
-# Maximum tags to process per UI update batch
-# Prevents UI freeze if many tags arrive at once
-MAX_TAGS_PER_UPDATE = 50
+# Interval for flushing coalesced log lines to the UI, in milliseconds
+# Log appends touch a QTextEdit on the GUI thread - a known Pi stutter
+# source when emitted per-line from hot paths
+LOG_FLUSH_INTERVAL_MS = 200
+
+# Maximum GUI-thread time budget per flush, in seconds
+# Bounds how long one flush may occupy the UI thread; if tags remain
+# after the budget, a short single-shot timer continues the drain
+FLUSH_TIME_BUDGET_S = 0.008
+
+# Inventory command interval, in seconds
+# Pi: 80ms gives ~12 scans/sec (plenty for RFID)
+# Desktop: 50ms gives ~20 scans/sec
+_SCAN_INTERVAL = 0.080 if IS_RASPBERRY_PI else 0.050
+
+# Maximum tags allowed to sit in the hand-off queue
+# If the UI thread falls behind, oldest tags are dropped first
+MAX_TAG_QUEUE_DEPTH = 1000
+
+# Precomputed FastSwitchInventory (0x8A) antenna configs keyed by the
+# 4-antenna enable mask. Format per antenna: [Stay][Count] where Stay is
+# the dwell slot (0x00-0x03) and Count is 0x01 enabled / 0x00 disabled,
+# followed by 2 reserved bytes. Only 16 masks exist, so build them once.
+_ANT_CONFIG_TABLE = {
+    mask: bytes([
+        0x00, mask[0],
+        0x01, mask[1],
+        0x02, mask[2],
+        0x03, mask[3],
+        0x00, 0x00
+    ])
+    for mask in itertools.product((0, 1), repeat=4)
+}
 
 
 class ReaderController(QObject):
@@ -54,8 +86,7 @@ class ReaderController(QObject):
     
     # Signals for thread-safe UI updates
     log_message = pyqtSignal(str, int)  # message, type
-    tag_received = pyqtSignal(dict)  # Kept for compatibility, but batched
-    tags_batch_received = pyqtSignal(list)  # New: batch of tags for efficiency
+    logs_batch = pyqtSignal(list)  # [(message, type), ...] coalesced hot-path logs
     counts_updated = pyqtSignal(int, int)  # unique, total
     detected_tags_updated = pyqtSignal(list)
     connection_changed = pyqtSignal(bool, str)
@@ -71,36 +102,71 @@ class ReaderController(QObject):
         
         self._is_inventory_running = False
         self._inventory_thread = None
-        self._response_buffer = bytearray()
-        
-        # Antenna configuration for FastSwitchInventory (0x8A command)
-        # Format: [Stay][Count] pairs for 4 antennas + 2 reserved bytes
-        # Stay = antenna dwell time (0x00-0x03), Count = 0x01 enabled, 0x00 disabled
-        # Default: ANT1 and ANT2 enabled
-        self._antenna_config = bytearray([
-            0x00, 0x01,  # ANT1: stay=0, enabled
-            0x01, 0x01,  # ANT2: stay=1, enabled
-            0x02, 0x00,  # ANT3: stay=2, disabled
-            0x03, 0x00,  # ANT4: stay=3, disabled
-            0x00, 0x00   # Reserved
-        ])
-        
+        self._frame_parser = FrameParser()
+
+        # Tags parsed from the current serial chunk, handed to the model
+        # in one batched process_tags call per chunk
+        self._pending_tags = []
+
+        # Linux: QSocketNotifier driving serial reads off the Qt event
+        # loop instead of the SerialManager polling thread
+        self._serial_notifier = None
+
+        # Coalesced log buffer for hot paths (sensor data, serial errors)
+        # flushed in one batch per LOG_FLUSH_INTERVAL_MS
+        self._log_buffer = []
+        self._log_buffer_lock = threading.Lock()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
+        self._log_flush_timer.start()
+        
+        # Antenna configuration for FastSwitchInventory (0x8A command),
+        # taken from the precomputed mask table. Default: ANT1 + ANT2.
+        # The pre-built inventory command frame is refreshed alongside it
+        # in start_inventory.
+        self._antenna_config_bytes = _ANT_CONFIG_TABLE[(1, 1, 0, 0)]
+        self._inv_cmd = ReaderProtocol.build_fast_switch_inventory(0xFF, self._antenna_config_bytes)
+
         # =====================================================
         # RASPBERRY PI: Batched UI update system
         # Instead of updating UI for every tag, we queue tags
         # and update UI in batches via QTimer
+        # SimpleQueue is lock-free for the 1-producer/1-consumer
+        # hand-off (serial thread -> UI thread), so no explicit
+        # lock is needed on the hot per-tag path
         # =====================================================
-        self._tag_queue = deque(maxlen=1000)  # Thread-safe queue
-        self._tag_queue_lock = threading.Lock()
+        self._tag_queue = queue.SimpleQueue()
         self._counts_dirty = False  # Flag to indicate counts need update
-        self._last_unique_count = 0
-        self._last_total_count = 0
+        # Count snapshot maintained on the serial thread when the model
+        # is updated; the flush timer just emits it (no model polling)
+        self._unique_count = 0
+        self._total_count = 0
         
         # Timer for batched UI updates
+        # The interval adapts: it backs off while the queue stays idle and
+        # snaps back to the base interval as soon as tags arrive again
+        self._base_interval = UI_UPDATE_INTERVAL_MS
+        self._idle_flushes = 0
         self._ui_update_timer = QTimer(self)
         self._ui_update_timer.setInterval(UI_UPDATE_INTERVAL_MS)
         self._ui_update_timer.timeout.connect(self._flush_ui_updates)
         
+        # cmd -> handler dispatch for inbound frames (built once; bound
+        # methods so the hot path is a single dict hit per frame)
+        self._frame_handlers = {
+            0x8A: self._handle_inventory_response,
+            0x72: self._handle_firmware_response,
+            0x68: self._handle_reader_id_response,
+            0x7B: self._handle_temperature_response,
+            0x76: self._handle_set_power_response,
+            0x77: self._handle_get_power_response,
+            0x97: self._handle_get_power_response,
+            0x6A: self._handle_rf_profile_response,
+            0x60: self._handle_gpio_response,
+            0x7E: self._handle_s11_response,
+        }
+
         self._setup_connections()
         self._setup_model_callbacks()
     
@@ -139,9 +205,8 @@ class ReaderController(QObject):
         
         # Controller signals to view
         self.log_message.connect(self._view.append_log)
+        self.logs_batch.connect(self._view.append_logs)
         self.connection_changed.connect(self._view.set_connected_state)
-        self.tag_received.connect(self._on_tag_received_ui)
-        self.tags_batch_received.connect(self._on_tags_batch_received_ui)  # Pi optimization
         self.counts_updated.connect(self._view.update_tag_counts)
         self.detected_tags_updated.connect(self._view.update_detected_tags)
         self.reader_info_updated.connect(self._view.update_reader_info)
@@ -149,20 +214,46 @@ class ReaderController(QObject):
     
     def _setup_model_callbacks(self):
         """Setup callbacks from model"""
+        # Model/serial callbacks fire on the serial thread - route them
+        # through the coalesced log buffer instead of per-line signals
         self._model.set_callbacks(
             on_tag=self._on_tag_detected,
             on_sensor=self._on_sensor_triggered,
-            on_log=lambda msg: self.log_message.emit(msg, 0)
+            on_log=lambda msg: self._log(msg, 0)
         )
-        
+
         # Setup serial callbacks
         self._serial.set_callbacks(
             on_data=self._on_data_received,
             on_sensor=self._on_sensor_data,
             on_cts=self._on_cts_changed,
             on_dsr=self._on_dsr_changed,
-            on_error=lambda msg: self.log_message.emit(msg, 1)
+            on_error=lambda msg: self._log(msg, 1)
         )
+
+    # ============================================================
+    # RASPBERRY PI: Coalesced log buffer
+    # ============================================================
+
+    def _log(self, message: str, log_type: int = 0):
+        """
+        Buffer a log line for batched emission
+
+        Hot paths call this instead of log_message.emit so the GUI
+        QTextEdit is touched at most once per LOG_FLUSH_INTERVAL_MS.
+        Thread-safe: can be called from the serial thread.
+        """
+        with self._log_buffer_lock:
+            self._log_buffer.append((message, log_type))
+
+    def _flush_log_buffer(self):
+        """Emit all buffered log lines in one batch (timer-driven)"""
+        if not self._log_buffer:
+            return
+        with self._log_buffer_lock:
+            entries = self._log_buffer
+            self._log_buffer = []
+        self.logs_batch.emit(entries)
     
     # ============================================================
     # RASPBERRY PI: Batched UI Update System
@@ -179,41 +270,75 @@ class ReaderController(QObject):
         """
         if not self._is_inventory_running:
             return
-        
-        # Collect tags from queue (up to MAX_TAGS_PER_UPDATE)
+
+        # Early-out: nothing queued and counts unchanged means no work
+        if not self._counts_dirty and self._tag_queue.empty():
+            # Back off the timer while idle to cut wake-ups on Pi
+            self._idle_flushes += 1
+            if self._idle_flushes == 20:
+                self._ui_update_timer.setInterval(self._base_interval * 2)
+            elif self._idle_flushes == 60:
+                self._ui_update_timer.setInterval(self._base_interval * 4)
+            return
+
+        # Real work arrived - snap back to the base interval
+        if self._idle_flushes:
+            self._idle_flushes = 0
+            self._ui_update_timer.setInterval(self._base_interval)
+
+        # Collect tags from queue under a fixed time budget so a heavy
+        # read burst cannot stall the GUI thread. Pre-bound methods keep
+        # the drain loop free of per-iteration attribute lookups
         tags_to_update = []
-        with self._tag_queue_lock:
-            for _ in range(min(len(self._tag_queue), MAX_TAGS_PER_UPDATE)):
-                if self._tag_queue:
-                    tags_to_update.append(self._tag_queue.popleft())
+        get = self._tag_queue.get_nowait
+        append = tags_to_update.append
+        monotonic = time.monotonic
+        deadline = monotonic() + FLUSH_TIME_BUDGET_S
+        try:
+            while monotonic() < deadline:
+                append(get())
+        except queue.Empty:
+            pass
         
         # Update UI with batched tags
         if tags_to_update:
-            # Emit batch signal for efficient processing
-            self.tags_batch_received.emit(tags_to_update)
+            # _flush_ui_updates already runs on the GUI thread (QTimer),
+            # so call the view directly instead of paying signal/slot
+            # marshaling for a same-thread hop
+            self._on_tags_batch_received_ui(tags_to_update)
         
-        # Update counts only if changed (dirty flag optimization)
+        # Emit the count snapshot if it changed (change detection already
+        # happened on the serial thread when the model was updated)
         if self._counts_dirty:
-            current_unique = self._model.epc_count
-            current_total = self._model.total_tag_count
-            
-            # Only emit if actually changed
-            if current_unique != self._last_unique_count or current_total != self._last_total_count:
-                self._last_unique_count = current_unique
-                self._last_total_count = current_total
-                self.counts_updated.emit(current_unique, current_total)
-            
             self._counts_dirty = False
-    
-    def _queue_tag_for_ui(self, tag_dict: dict):
+            self.counts_updated.emit(self._unique_count, self._total_count)
+
+        # Tags remained past the budget - resume shortly instead of
+        # waiting a full timer interval (keeps queue depth bounded)
+        if not self._tag_queue.empty():
+            QTimer.singleShot(1, self._flush_ui_updates)
+
+    def _queue_tags_for_ui(self, tag_dicts: list):
         """
-        Queue a tag for batched UI update instead of immediate emission
-        
+        Queue a burst of tags for batched UI update instead of
+        immediate emission - one cap check and dirty-flag write
+        per burst rather than per tag
+
         Thread-safe: can be called from serial read thread
         """
-        with self._tag_queue_lock:
-            self._tag_queue.append(tag_dict)
-        self._counts_dirty = True
+        # Enforce the queue cap by dropping the oldest tags first
+        # (UI thread fell behind; fresh reads are more useful)
+        overshoot = self._tag_queue.qsize() + len(tag_dicts) - MAX_TAG_QUEUE_DEPTH
+        if overshoot > 0:
+            try:
+                for _ in range(overshoot):
+                    self._tag_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+        put = self._tag_queue.put_nowait
+        for tag_dict in tag_dicts:
+            put(tag_dict)
     
     # ============================================================
     # Connection Methods
@@ -224,19 +349,56 @@ class ReaderController(QObject):
         """Connect to RFID reader"""
         params = ConnectionParams(port=port, baudrate=baudrate)
         success, message = self._serial.connect_reader(params)
-        
+
+        if success:
+            self._setup_serial_notifier()
+
         self.connection_changed.emit(success, message)
         self.log_message.emit(message, 2 if success else 1)
-    
+
     @pyqtSlot()
     def disconnect_reader(self):
         """Disconnect from reader"""
         if self._is_inventory_running:
             self.stop_inventory()
-        
+
+        self._teardown_serial_notifier()
         success, message = self._serial.disconnect_reader()
         self.connection_changed.emit(False, message)
         self.log_message.emit(message, 0)
+
+    def _setup_serial_notifier(self):
+        """
+        Drive reader data off the Qt event loop via QSocketNotifier
+
+        RASPBERRY PI OPTIMIZATION:
+        On Linux the serial port exposes a selectable fd, so the event
+        loop can wake us exactly when data arrives - no polling thread
+        hand-off, roughly half the context switches. The monitor thread
+        keeps running for CTS/DSR edges only. On platforms without a
+        selectable fd we fall back to the polling thread.
+        """
+        fd = self._serial.reader_fileno()
+        if fd is None:
+            return
+
+        self._serial.set_external_read(True)
+        self._serial_notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read, self)
+        self._serial_notifier.activated.connect(self._on_serial_ready)
+
+    def _teardown_serial_notifier(self):
+        """Disable the read notifier and return reads to the poll thread"""
+        if self._serial_notifier is not None:
+            self._serial_notifier.setEnabled(False)
+            self._serial_notifier.deleteLater()
+            self._serial_notifier = None
+        self._serial.set_external_read(False)
+
+    def _on_serial_ready(self):
+        """Serial fd became readable - pull waiting bytes and parse"""
+        data = self._serial.read_available()
+        if data:
+            self._on_data_received(data)
     
     @pyqtSlot(str, int)
     def connect_sensor(self, port: str, baudrate: int):
@@ -265,36 +427,35 @@ class ReaderController(QObject):
             self.log_message.emit("Reader not connected", 1)
             return
         
-        # Update antenna configuration
-        # Format: [Stay][Count] for each antenna (4 antennas + 2 reserved bytes = 10 bytes)
-        # Stay = dwell time per antenna (0x00-0x03 recommended, higher = longer dwell)
-        # Count = 0x01 to enable, 0x00 to disable
+        # Update antenna configuration from the precomputed mask table
+        # (see _ANT_CONFIG_TABLE for the [Stay][Count] byte layout)
         # IMPORTANT: Using 0xFF as stay causes reader to skip that antenna!
         antennas = config.get('antennas', [True, True, False, False])
-        
-        # Build config with consistent stay values for all enabled antennas
-        self._antenna_config = bytearray([
-            0x00, 0x01 if antennas[0] else 0x00,  # ANT1: stay=0, enabled?
-            0x01, 0x01 if antennas[1] else 0x00,  # ANT2: stay=1, enabled?
-            0x02, 0x01 if antennas[2] else 0x00,  # ANT3: stay=2, enabled?
-            0x03, 0x01 if antennas[3] else 0x00,  # ANT4: stay=3, enabled?
-            0x00, 0x00  # Reserved
-        ])
-        
+        self._antenna_config_bytes = _ANT_CONFIG_TABLE[tuple(1 if a else 0 for a in antennas)]
+
         # Log which antennas are enabled
         enabled = [f"ANT{i+1}" for i, en in enumerate(antennas) if en]
         self.log_message.emit(f"Antennas enabled: {', '.join(enabled) if enabled else 'None'}", 0)
+
+        # Pre-build the inventory command once - the frame (header + checksum)
+        # is identical for every scan, so rebuilding it per iteration is waste
+        self._inv_cmd = ReaderProtocol.build_fast_switch_inventory(0xFF, self._antenna_config_bytes)
         
         self._is_inventory_running = True
         self._view.set_inventory_running(True)
         
         # Clear the tag queue before starting
-        with self._tag_queue_lock:
-            self._tag_queue.clear()
+        try:
+            while True:
+                self._tag_queue.get_nowait()
+        except queue.Empty:
+            pass
         self._counts_dirty = False
         
         # Start the UI update timer (RASPBERRY PI OPTIMIZATION)
         # This batches UI updates instead of updating per-tag
+        self._idle_flushes = 0
+        self._ui_update_timer.setInterval(self._base_interval)
         self._ui_update_timer.start()
         
         # Start inventory thread
@@ -337,26 +498,29 @@ class ReaderController(QObject):
         RASPBERRY PI OPTIMIZATION:
         Uses longer delay between commands to reduce CPU load
         and give the reader time to respond properly.
+        Paced off a monotonic deadline so the scan cadence stays
+        stable instead of drifting by the sleep/send overhead.
         """
-        import time
-        
-        # Inventory command interval
-        # Pi: 80ms gives ~12 scans/sec (plenty for RFID)
-        # Desktop: 50ms gives ~20 scans/sec
-        scan_interval = 0.080 if IS_RASPBERRY_PI else 0.050
-        
+        next_t = time.monotonic()
         while self._is_inventory_running:
-            # Send fast switch inventory command
-            cmd = ReaderProtocol.build_fast_switch_inventory(0xFF, bytes(self._antenna_config))
-            self._serial.send_command(cmd)
-            
-            # Delay between scans - critical for Pi stability
-            time.sleep(scan_interval)
+            # Send the pre-built fast switch inventory command
+            self._serial.send_command(self._inv_cmd)
+
+            # Sleep until the next deadline - critical for Pi stability
+            next_t += _SCAN_INTERVAL
+            dt = next_t - time.monotonic()
+            if dt > 0:
+                time.sleep(dt)
+            else:
+                # Fell behind (slow send) - rebase instead of bursting
+                next_t = time.monotonic()
     
     @pyqtSlot()
     def clear_data(self):
         """Clear all inventory data"""
         self._model.clear_data()
+        self._unique_count = 0
+        self._total_count = 0
         self.counts_updated.emit(0, 0)
         self.log_message.emit("Data cleared", 0)
     
@@ -376,8 +540,17 @@ class ReaderController(QObject):
         
         if filename:
             data = self._model.get_history_for_export()
-            success, message = ExcelExporter.export_read_history(data, filename)
-            self.log_message.emit(message, 2 if success else 1)
+            # Write off the GUI thread: an XLSX save on the Pi's SD
+            # card can stall the event loop for seconds
+            worker = ExportWorker(
+                ExcelExporter.export_read_history, data, filename)
+            worker.signals.finished.connect(self._on_export_finished)
+            QThreadPool.globalInstance().start(worker)
+
+    @pyqtSlot(bool, str)
+    def _on_export_finished(self, success: bool, message: str):
+        """Report the background export result in the log"""
+        self.log_message.emit(message, 2 if success else 1)
     
     # ============================================================
     # Data Processing
@@ -385,127 +558,140 @@ class ReaderController(QObject):
     
     def _on_data_received(self, data: bytes):
         """Handle data received from reader"""
-        self._response_buffer.extend(data)
-        self._process_buffer()
-    
-    def _process_buffer(self):
-        """Process the response buffer for complete frames"""
-        while len(self._response_buffer) >= 5:
-            # Look for frame start
-            if self._response_buffer[0] != 0xA0:
-                self._response_buffer.pop(0)
-                continue
-            
-            # Check if we have complete frame
-            frame_len = self._response_buffer[1]
-            if len(self._response_buffer) < frame_len + 2:
-                break  # Wait for more data
-            
-            # Extract frame
-            frame = bytes(self._response_buffer[:frame_len + 2])
-            self._response_buffer = self._response_buffer[frame_len + 2:]
-            
-            # Parse and process
+        for frame in self._frame_parser.feed(data):
             self._process_frame(frame)
+
+        # Hand the whole burst of inventory tags to the model at once
+        if self._pending_tags:
+            self._flush_pending_tags()
+
+    def _flush_pending_tags(self):
+        """Process the accumulated inventory burst in one model call"""
+        pending = self._pending_tags
+        self._pending_tags = []
+
+        counts = self._model.process_tags([tag for tag, _ in pending])
+
+        ui_tags = []
+        for tag, tag_data in pending:
+            count = counts.get(tag_data['epc'])
+            if count is None:
+                continue  # Filtered by the model (blank/reserved EPC)
+            ui_tags.append(TagEvent(
+                epc=tag_data['epc'],
+                antenna=tag_data['antenna'],
+                count=count,
+                rssi=tag_data['rssi'],
+                frequency=tag_data['frequency']
+            ))
+
+        if ui_tags:
+            self._queue_tags_for_ui(ui_tags)
+
+        # Snapshot the counts here (serial thread) and flag the flush
+        # timer only when they actually changed - it emits the snapshot
+        # without touching the model
+        unique = self._model.epc_count
+        total = self._model.total_tag_count
+        if unique != self._unique_count or total != self._total_count:
+            self._unique_count = unique
+            self._total_count = total
+            self._counts_dirty = True
     
     def _process_frame(self, frame: bytes):
         """
         Process a complete response frame
-        
+
         RASPBERRY PI OPTIMIZATION:
-        Instead of emitting signals for each tag, we queue them
-        for batched UI updates. This dramatically reduces CPU/GPU
-        load on the Pi.
+        Dispatches through a prebuilt cmd -> handler dict, so the
+        hot inventory response (0x8A) is a single hash lookup
+        instead of walking an if/elif chain for every frame.
         """
         result = ReaderProtocol.parse_response(frame)
-        
+
         if not result['valid']:
             return
-        
-        cmd = result['cmd']
-        data = result['data']
-        
-        # Handle fast switch inventory response
-        if cmd == 0x8A and self._is_inventory_running:
-            tag_data = ReaderProtocol.parse_tag_data(cmd, data)
-            if tag_data and tag_data['epc']:
-                tag = RXInventoryTag(
-                    str_epc=tag_data['epc'],
-                    str_rssi=str(tag_data['rssi']),
-                    bt_ant_id=tag_data['antenna'],
-                    str_freq=tag_data['frequency'],
-                    str_pc=tag_data['pc']
-                )
-                self._model.process_tag(tag)
-                
-                # RASPBERRY PI OPTIMIZATION:
-                # Queue tag for batched UI update instead of immediate emission
-                # The _flush_ui_updates() method will emit signals in batches
-                self._queue_tag_for_ui({
-                    'epc': tag_data['epc'],
-                    'antenna': tag_data['antenna'],
-                    'count': self._model.get_tag_count(tag_data['epc']),
-                    'rssi': tag_data['rssi'],
-                    'frequency': tag_data['frequency']
-                })
-                # Don't emit counts_updated here - handled by _flush_ui_updates()
-        
-        # Handle other responses
-        elif cmd == 0x72:  # Firmware version
-            if len(data) >= 2:
-                fw = f"{data[0]}.{data[1]}"
-                self.reader_info_updated.emit({'firmware': fw})
-        
-        elif cmd == 0x68:  # Reader ID
-            reader_id = data.hex().upper()
-            self.reader_info_updated.emit({'reader_id': reader_id})
-        
-        elif cmd == 0x7B:  # Temperature
-            if len(data) >= 2:
-                sign = "" if data[0] != 0 else "-"
-                temp = f"{sign}{data[1]}°C"
-                self.reader_info_updated.emit({'temperature': temp})
-        
-        elif cmd == 0x76:  # Set Power response
-            # Response from SET power command
-            # data[0] == 0x10 means success, other values are error codes
-            if len(data) >= 1:
-                if data[0] == 0x10:
-                    self.log_message.emit("Power set successfully", 2)
-                else:
-                    self.log_message.emit(f"Set power failed: error 0x{data[0]:02X}", 1)
-        
-        elif cmd == 0x77 or cmd == 0x97:  # Get Power response
-            # Response from GET power command (0x77=4-ant, 0x97=8-ant)
-            powers = list(data[:4]) if len(data) >= 4 else list(data)
-            self.reader_info_updated.emit({'powers': powers})
-            self.log_message.emit(f"Power levels: {powers} dBm", 0)
-        
-        elif cmd == 0x6A:  # RF Profile
-            if data:
-                self.reader_info_updated.emit({'rf_profile': data[0]})
-        
-        elif cmd == 0x60:  # GPIO read
-            if len(data) >= 2:
-                self.gpio_state_updated.emit({
-                    1: data[0] != 0,
-                    2: data[1] != 0,
-                    3: data[2] != 0 if len(data) > 2 else False,
-                    4: data[3] != 0 if len(data) > 3 else False
-                })
-        
-        elif cmd == 0x7E:  # S11 measurement
-            if data:
-                self._view.gpio_page.set_s11_result(data[0])
+
+        handler = self._frame_handlers.get(result['cmd'])
+        if handler:
+            handler(result['data'])
+
+    def _handle_inventory_response(self, data: bytes):
+        """Handle fast switch inventory response (0x8A)"""
+        if not self._is_inventory_running:
+            return
+
+        tag_data = ReaderProtocol.parse_tag_data(0x8A, data)
+        if tag_data and tag_data['epc']:
+            tag = RXInventoryTag(
+                str_epc=tag_data['epc'],
+                str_rssi=str(tag_data['rssi']),
+                bt_ant_id=tag_data['antenna'],
+                str_freq=tag_data['frequency'],
+                str_pc=tag_data['pc']
+            )
+            # RASPBERRY PI OPTIMIZATION:
+            # Accumulate the burst; _on_data_received hands the whole
+            # chunk to the model via one process_tags call
+            self._pending_tags.append((tag, tag_data))
+
+    def _handle_firmware_response(self, data: bytes):
+        """Handle firmware version response (0x72)"""
+        if len(data) >= 2:
+            fw = f"{data[0]}.{data[1]}"
+            self.reader_info_updated.emit({'firmware': fw})
+
+    def _handle_reader_id_response(self, data: bytes):
+        """Handle reader ID response (0x68)"""
+        reader_id = data.hex().upper()
+        self.reader_info_updated.emit({'reader_id': reader_id})
+
+    def _handle_temperature_response(self, data: bytes):
+        """Handle temperature response (0x7B)"""
+        if len(data) >= 2:
+            sign = "" if data[0] != 0 else "-"
+            temp = f"{sign}{data[1]}°C"
+            self.reader_info_updated.emit({'temperature': temp})
+
+    def _handle_set_power_response(self, data: bytes):
+        """Handle set power response (0x76)"""
+        # data[0] == 0x10 means success, other values are error codes
+        if len(data) >= 1:
+            if data[0] == 0x10:
+                self.log_message.emit("Power set successfully", 2)
+            else:
+                self.log_message.emit(f"Set power failed: error 0x{data[0]:02X}", 1)
+
+    def _handle_get_power_response(self, data: bytes):
+        """Handle get power response (0x77=4-ant, 0x97=8-ant)"""
+        powers = list(data[:4]) if len(data) >= 4 else list(data)
+        self.reader_info_updated.emit({'powers': powers})
+        self.log_message.emit(f"Power levels: {powers} dBm", 0)
+
+    def _handle_rf_profile_response(self, data: bytes):
+        """Handle RF profile response (0x6A)"""
+        if data:
+            self.reader_info_updated.emit({'rf_profile': data[0]})
+
+    def _handle_gpio_response(self, data: bytes):
+        """Handle GPIO read response (0x60)"""
+        if len(data) >= 2:
+            self.gpio_state_updated.emit({
+                1: data[0] != 0,
+                2: data[1] != 0,
+                3: data[2] != 0 if len(data) > 2 else False,
+                4: data[3] != 0 if len(data) > 3 else False
+            })
+
+    def _handle_s11_response(self, data: bytes):
+        """Handle S11 measurement response (0x7E)"""
+        if data:
+            self._view.gpio_page.set_s11_result(data[0])
     
     def _on_tag_detected(self, tag: RXInventoryTag):
         """Called when model detects a tag"""
         pass  # Handled in _process_frame
     
-    def _on_tag_received_ui(self, tag_dict: dict):
-        """Update UI with single tag data (called from main thread)"""
-        self._view.inventory_page.add_tag(tag_dict)
-    
     def _on_tags_batch_received_ui(self, tags_list: list):
         """
         Update UI with batch of tags (RASPBERRY PI OPTIMIZATION)
@@ -514,6 +700,9 @@ class ReaderController(QObject):
         in a single UI update cycle, which is much more efficient
         than updating per-tag on resource-constrained devices.
         """
+        if not tags_list:
+            return
+
         # Use batch update method if available, otherwise fall back to single updates
         if hasattr(self._view.inventory_page, 'add_tags_batch'):
             self._view.inventory_page.add_tags_batch(tags_list)
@@ -524,7 +713,7 @@ class ReaderController(QObject):
     
     def _on_sensor_triggered(self, direction: SensorDirection, time_diff: float):
         """Called when sensor direction is determined"""
-        self.log_message.emit(f"Sensor triggered: {direction.name} ({time_diff:.1f}ms)", 3)
+        self._log(f"Sensor triggered: {direction.name} ({time_diff:.1f}ms)", 3)
         
         # Stop inventory and analyze
         if self._is_inventory_running:
@@ -541,7 +730,7 @@ class ReaderController(QObject):
     
     def _on_sensor_data(self, text: str):
         """Handle sensor port data"""
-        self.log_message.emit(f"Sensor: {text.strip()}", 0)
+        self._log(f"Sensor: {text.strip()}", 0)
         
         now = datetime.now()
         if "#1" in text:
@@ -721,5 +910,6 @@ class ReaderController(QObject):
         self._is_inventory_running = False
         if self._inventory_thread:
             self._inventory_thread.join(timeout=2.0)
+        self._teardown_serial_notifier()
         self._serial.cleanup()
 
@@ -30,33 +30,31 @@ import os
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt, QLocale
-from PyQt6.QtGui import QFont, QFontDatabase
-
-# High DPI support
-if hasattr(Qt, 'HighDpiScaleFactorRoundingPolicy'):
-    QApplication.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
-    )
-
-
 def setup_fonts():
     """Setup application fonts"""
-    # Try to use Segoe UI (Windows 11 default)
-    preferred_fonts = ["Segoe UI", "SF Pro Display", "Helvetica Neue", "Arial"]
-    
-    available_families = QFontDatabase.families()
-    
-    for font_name in preferred_fonts:
-        if font_name in available_families:
-            return QFont(font_name, 10)
-    
-    return QFont("Arial", 10)
+    from PyQt6.QtGui import QFont
+
+    # Hand Qt the whole preference list (Segoe UI is the Windows 11
+    # default) and let its lazy font matching pick the first installed
+    # family - no probing, no database enumeration at startup
+    font = QFont()
+    font.setFamilies(["Segoe UI", "SF Pro Display", "Helvetica Neue", "Arial"])
+    font.setPointSize(10)
+    return font
 
 
 def main():
     """Application entry point with Raspberry Pi optimization"""
+    # Qt imports live here so importing main stays cheap
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt, QLocale
+
+    # High DPI support
+    if hasattr(Qt, 'HighDpiScaleFactorRoundingPolicy'):
+        QApplication.setHighDpiScaleFactorRoundingPolicy(
+            Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+        )
+
     # Create application
     app = QApplication(sys.argv)
     app.setApplicationName("RFID Reader")
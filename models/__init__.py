@@ -1,13 +1,14 @@
 # Models package
-from .data_models import EPCReadEvent, SensorState, SensorDirection, ReaderSettings, RXInventoryTag
+from .data_models import EPCReadEvent, SensorState, SensorDirection, ReaderSettings, RXInventoryTag, TagEvent
 from .reader_model import ReaderModel
 
 __all__ = [
     'EPCReadEvent',
-    'SensorState', 
+    'SensorState',
     'SensorDirection',
     'ReaderSettings',
     'RXInventoryTag',
+    'TagEvent',
     'ReaderModel'
 ]
 
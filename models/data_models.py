@@ -3,11 +3,11 @@ Data Models for RFID Reader Application
 Defines core data structures used throughout the application
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, auto
 from typing import Optional, List, Dict
-import threading
+import time
 
 
 class SensorDirection(Enum):
@@ -17,7 +17,12 @@ class SensorDirection(Enum):
     OUT = auto()  # S1 activates before S2
 
 
-@dataclass
+# Translation table for canonicalizing EPC strings: strips whitespace
+# and dashes in one C-level pass (str.translate)
+_EPC_STRIP = str.maketrans('', '', ' \t\n\r\v\f-')
+
+
+@dataclass(slots=True)
 class EPCReadEvent:
     """Represents a single RFID tag read event"""
     epc: str
@@ -26,13 +31,43 @@ class EPCReadEvent:
     antenna: int
     frequency: str = ""
     pc: str = ""
-    
+    # Canonical EPC (uppercased, separators stripped), computed once at
+    # ingest so analysis never re-canonicalizes per event
+    canon_epc: str = ""
+    # Interned integer id for the canonical EPC, assigned by ReaderModel
+    # at ingest; lets analysis group on small ints instead of strings
+    epc_id: int = -1
+    # Monotonic nanosecond timestamp used by all hot-path time math;
+    # read_time (wall clock) is kept only for display and export
+    read_time_ns: int = 0
+
     def __post_init__(self):
-        if self.read_time is None:
-            self.read_time = datetime.now()
+        if not self.read_time_ns:
+            self.read_time_ns = time.monotonic_ns()
+        if not self.canon_epc:
+            self.canon_epc = self.epc.translate(_EPC_STRIP).upper() if self.epc else ""
 
 
-@dataclass
+class TagEvent:
+    """
+    Fixed-layout tag event handed from the serial thread to the UI
+
+    Uses __slots__ instead of a dict: on a busy scan the Pi pushes
+    hundreds of these per second through the hand-off queue, and a
+    slotted instance is less than half the size of a 5-key dict with
+    faster (C-level slot) field access.
+    """
+    __slots__ = ('epc', 'antenna', 'count', 'rssi', 'frequency')
+
+    def __init__(self, epc: str, antenna: int, count: int, rssi: int, frequency: str):
+        self.epc = epc
+        self.antenna = antenna
+        self.count = count
+        self.rssi = rssi
+        self.frequency = frequency
+
+
+@dataclass(slots=True)
 class RXInventoryTag:
     """Inventory tag data received from reader"""
     str_pc: str = ""
@@ -43,32 +78,40 @@ class RXInventoryTag:
     cmd: int = 0
 
 
-@dataclass 
+@dataclass
 class SensorState:
-    """Manages sensor state for direction detection"""
+    """
+    Manages sensor state for direction detection
+
+    Not internally synchronized: all mutation happens under
+    ReaderModel._sensor_lock.
+    """
     s1_activated_time: Optional[datetime] = None
     s2_activated_time: Optional[datetime] = None
+    # Monotonic ns counterparts used for ordering and time-difference
+    # math (integer compares, no timedelta allocation)
+    s1_activated_ns: int = 0
+    s2_activated_ns: int = 0
     s1_was_active: bool = False
     s2_was_active: bool = False
     last_direction: SensorDirection = SensorDirection.X
-    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
-    
+
     @property
     def both_sensors_activated(self) -> bool:
         """Check if both sensors have been activated"""
         return self.s1_activated_time is not None and self.s2_activated_time is not None
-    
+
     def get_direction(self) -> SensorDirection:
         """Determine direction based on sensor activation order"""
         if not self.both_sensors_activated:
             return SensorDirection.X
-        return SensorDirection.OUT if self.s1_activated_time < self.s2_activated_time else SensorDirection.IN
-    
+        return SensorDirection.OUT if self.s1_activated_ns < self.s2_activated_ns else SensorDirection.IN
+
     def get_time_difference_ms(self) -> float:
         """Get time difference between sensor activations in milliseconds"""
         if not self.both_sensors_activated:
             return 0.0
-        return abs((self.s2_activated_time - self.s1_activated_time).total_seconds() * 1000)
+        return abs(self.s2_activated_ns - self.s1_activated_ns) / 1e6
     
     def get_trigger_time(self) -> datetime:
         """Get the trigger time (whichever sensor activated last)"""
@@ -80,10 +123,12 @@ class SensorState:
         """Reset sensor state"""
         self.s1_activated_time = None
         self.s2_activated_time = None
+        self.s1_activated_ns = 0
+        self.s2_activated_ns = 0
         self.last_direction = SensorDirection.X
 
 
-@dataclass
+@dataclass(slots=True)
 class ReaderSettings:
     """Reader configuration settings"""
     # Reader identification
@@ -149,6 +194,11 @@ class FrequencyRegion(Enum):
         self.end_freq = end
         self.description = description
 
+    @classmethod
+    def from_code(cls, region_code: int, start_freq: int, end_freq: int) -> Optional['FrequencyRegion']:
+        """O(1) lookup by the reader's (region, start, end) bytes"""
+        return _REGION_BY_CODE.get((region_code, start_freq, end_freq))
+
 
 class RFLinkProfile(Enum):
     """RF Link profiles"""
@@ -161,6 +211,19 @@ class RFLinkProfile(Enum):
         self.code = code
         self.description = description
 
+    @classmethod
+    def from_code(cls, code: int) -> Optional['RFLinkProfile']:
+        """O(1) lookup by the reader's profile byte"""
+        return _PROFILE_BY_CODE.get(code)
+
+
+# Precomputed lookup maps so code->member resolution is a dict probe
+# instead of an enum scan
+_REGION_BY_CODE: Dict[tuple, FrequencyRegion] = {
+    (r.region_code, r.start_freq, r.end_freq): r for r in FrequencyRegion
+}
+_PROFILE_BY_CODE: Dict[int, RFLinkProfile] = {p.code: p for p in RFLinkProfile}
+
 
 class SessionTarget:
     """Session and Target settings for inventory"""
@@ -10,31 +10,30 @@ import os
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt, QLocale
-from PyQt6.QtGui import QFont, QFontDatabase
-
-# High DPI support
-if hasattr(Qt, 'HighDpiScaleFactorRoundingPolicy'):
-    QApplication.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
-    )
-
 def setup_fonts():
     """Setup application fonts"""
-    preferred_fonts = ["Segoe UI", "SF Pro Display", "Helvetica Neue", "Arial"]
-    available_families = QFontDatabase.families()
-    
-    for font_name in preferred_fonts:
-        if font_name in available_families:
-            return QFont(font_name, 10)
-    
-    return QFont("Arial", 10)
+    from PyQt6.QtGui import QFont
+
+    # Same lazy matching as main.py: hand Qt the preference list and
+    # skip the QFontDatabase enumeration
+    font = QFont()
+    font.setFamilies(["Segoe UI", "SF Pro Display", "Helvetica Neue", "Arial"])
+    font.setPointSize(10)
+    return font
 
 
 def main():
     """Application entry point - SIMULATING RASPBERRY PI 7\" SCREEN"""
-    
+    # Qt imports live here so importing the module stays cheap
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt, QLocale
+
+    # High DPI support
+    if hasattr(Qt, 'HighDpiScaleFactorRoundingPolicy'):
+        QApplication.setHighDpiScaleFactorRoundingPolicy(
+            Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+        )
+
     print("=" * 60)
     print("🧪 TEST MODE: Simulating Raspberry Pi 7\" Screen (1024x600)")
     print("=" * 60)
@@ -52,14 +51,13 @@ def main():
     QLocale.setDefault(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
     
     # Import UI config and FORCE small profile
+    import utils.ui_config
     from utils.ui_config import UIConfig
-    
-    # Create a custom config instance for testing
-    test_config = UIConfig()
-    test_config.screen_width = 1024
-    test_config.screen_height = 600
-    test_config.profile = 'small'
-    test_config._configure_ui_values()
+
+    # Build the forced config directly - no screen probe, no second
+    # values pass - and install it as the singleton
+    test_config = UIConfig.for_profile('small', 1024, 600)
+    utils.ui_config._config_instance = test_config
     
     print(f"✓ Forcing small profile")
     print(f"✓ Window will be: {test_config.window_width}x{test_config.window_height}")
@@ -68,11 +66,7 @@ def main():
     print(f"✓ Logo hidden: {not test_config.show_logo_in_header}")
     print("=" * 60)
     print()
-    
-    # Override the singleton
-    import utils.ui_config
-    utils.ui_config._config_instance = test_config
-    
+
     # Import here to avoid circular imports
     from views import MainWindow
     from controllers import ReaderController
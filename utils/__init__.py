@@ -1,26 +1,16 @@
 # Utils package
-from .serial_utils import (
-    SerialManager, 
-    get_available_ports, 
-    ConnectionParams, 
-    ReaderProtocol,
-    # Raspberry Pi / Linux specific
-    detect_rfid_reader_port,
-    check_linux_permissions,
-    IS_LINUX,
-    IS_RASPBERRY_PI,
-    SERIAL_POLL_INTERVAL,
-    SENSOR_POLL_INTERVAL
-)
-from .export_utils import ExcelExporter
-from .ui_config import get_ui_config, is_small_screen, is_raspberry_pi, UIConfig
+#
+# Submodules are imported lazily (PEP 562): `from utils import
+# ExcelExporter` no longer drags in pyserial and the Qt-dependent
+# ui_config module, and importing utils itself costs nothing until an
+# attribute is first touched.
 
-__all__ = [
-    'SerialManager', 
-    'get_available_ports', 
-    'ConnectionParams', 
-    'ReaderProtocol', 
-    'ExcelExporter',
+_SERIAL_EXPORTS = frozenset((
+    'SerialManager',
+    'get_available_ports',
+    'ConnectionParams',
+    'ReaderProtocol',
+    'FrameParser',
     # Raspberry Pi / Linux specific
     'detect_rfid_reader_port',
     'check_linux_permissions',
@@ -28,10 +18,39 @@ __all__ = [
     'IS_RASPBERRY_PI',
     'SERIAL_POLL_INTERVAL',
     'SENSOR_POLL_INTERVAL',
-    # Responsive UI configuration
+))
+
+_UI_CONFIG_EXPORTS = frozenset((
     'get_ui_config',
     'is_small_screen',
     'is_raspberry_pi',
-    'UIConfig'
+    'UIConfig',
+))
+
+_EXPORT_EXPORTS = frozenset((
+    'ExcelExporter',
+    'ExportWorker',
+))
+
+__all__ = [
+    *_SERIAL_EXPORTS,
+    *_EXPORT_EXPORTS,
+    *_UI_CONFIG_EXPORTS,
 ]
 
+
+def __getattr__(name):
+    if name in _SERIAL_EXPORTS:
+        from . import serial_utils
+        value = getattr(serial_utils, name)
+    elif name in _UI_CONFIG_EXPORTS:
+        from . import ui_config
+        value = getattr(ui_config, name)
+    elif name in _EXPORT_EXPORTS:
+        from . import export_utils
+        value = getattr(export_utils, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the package so the next lookup is a plain module-dict hit
+    globals()[name] = value
+    return value
@@ -9,21 +9,80 @@ military/industrial robotics control panel aesthetic:
 - HUDStatsWidget: Data display widget with large numeric value
 - TagGridView: Grid layout for tag cards
 - TagCardWidget: Individual tag data card with signal visualization
+- SignalBarsWidget: Painted signal-strength bars for tag cards
 - HUDButton: Custom button with angular styling and hover glow
 """
 
+import functools
+
 from PyQt6.QtWidgets import (
-    QWidget, QFrame, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QPushButton, QSizePolicy, QScrollArea
+    QWidget, QFrame, QVBoxLayout, QHBoxLayout,
+    QLabel, QListView, QPushButton, QSizePolicy,
+    QStyledItemDelegate
+)
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QSize, QTimer
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QPropertyAnimation, QEasingCurve, pyqtProperty
-from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QLinearGradient, QPainterPath, QFont, QIcon
+from PyQt6.QtGui import QFont, QFontMetrics, QPainter, QPixmap
 
 from qfluentwidgets import FluentIcon as FIF, IconWidget
 
 from .theme import HUDColors, HUDFonts
 
 
+# Shared colors for painted card content and signal bars (memoized in theme)
+_BAR_ON_COLOR = HUDColors.qcolor(HUDColors.PRIMARY)
+_BAR_OFF_COLOR = HUDColors.qcolor(HUDColors.BORDER_DIM)
+_EPC_COLOR = _BAR_ON_COLOR
+_SEPARATOR_COLOR = HUDColors.qcolor(HUDColors.BORDER)
+_DIM_COLOR = HUDColors.qcolor(HUDColors.TEXT_DIM)
+_VALUE_COLOR = HUDColors.qcolor(HUDColors.TEXT_PRIMARY)
+_SUCCESS_COLOR = HUDColors.qcolor(HUDColors.SUCCESS)
+_SECONDARY_COLOR = HUDColors.qcolor(HUDColors.SECONDARY)
+
+# Signal-bar geometry, precomputed once: (x offset, height) per bar
+_BAR_GEOMETRY = tuple((i * 10, 4 + i * 2) for i in range(8))
+
+
+# Width available for the EPC line on a 240px card (border + padding off)
+_EPC_TEXT_WIDTH = 218
+_EPC_METRICS = None
+
+
+@functools.lru_cache(maxsize=1024)
+def _elided_epc(epc: str) -> str:
+    """
+    Pixel-accurate elided "EPC: ..." line for one EPC
+
+    Cached per EPC so the font-metrics work happens once per tag, not
+    on every repaint; EPC strings are interned at ingestion, so repeat
+    reads hit the same cache entry.
+    """
+    global _EPC_METRICS
+    if _EPC_METRICS is None:
+        _EPC_METRICS = QFontMetrics(HUDFonts.get_monospace_font(9, bold=True))
+    return _EPC_METRICS.elidedText(f"EPC: {epc}",
+                                   Qt.TextElideMode.ElideRight,
+                                   _EPC_TEXT_WIDTH)
+
+
+@functools.lru_cache(maxsize=16)
+def _card_qss(glow: bool, border_color: str, bg: str) -> str:
+    """Shared stylesheet for a HUDCard variant.
+
+    Only a couple of (glow, border) combinations exist in practice, so
+    every card past the first reuses the same string and Qt can skip
+    re-parsing an identical stylesheet.
+    """
+    width = "2px" if glow else "1px"
+    return f"""
+        QFrame {{
+            border: {width} solid {border_color};
+            background-color: {bg};
+        }}
+    """
+
+
 class HUDCard(QFrame):
     """
     Container widget with angular/chamfered corners
@@ -37,37 +96,29 @@ class HUDCard(QFrame):
     - Optional glow effect
     """
     
-    def __init__(self, parent=None, corner_size: int = 10, glow: bool = False, 
+    def __init__(self, parent=None, corner_size: int = 10, glow: bool = False,
                  border_color: str = None):
         super().__init__(parent)
         self.corner_size = corner_size
         self.glow_enabled = glow
         self.border_color = border_color or HUDColors.BORDER
-        
-        self._setup_ui()
-    
-    def _setup_ui(self):
-        """Setup card styling"""
-        # Use QSS for basic styling
-        glow_shadow = ""
-        if self.glow_enabled:
-            glow_shadow = f"""
-                QFrame {{
-                    border: 2px solid {self.border_color};
-                    background-color: {HUDColors.BG_CARD};
-                }}
-            """
-        else:
-            glow_shadow = f"""
-                QFrame {{
-                    border: 1px solid {self.border_color};
-                    background-color: {HUDColors.BG_CARD};
-                }}
-            """
-        
-        self.setStyleSheet(glow_shadow)
+        # Styling is deferred to the first showEvent: cards sitting on
+        # never-opened pages stay out of Qt's style tree entirely
+        self._styled = False
+
+    def _apply_card_style(self):
+        """Apply card styling (not the virtual _setup_ui - subclasses
+        that build their UI there must not be rebuilt on show)"""
+        self.setStyleSheet(_card_qss(self.glow_enabled, self.border_color,
+                                     HUDColors.BG_CARD))
         self.setFrameShape(QFrame.Shape.StyledPanel)
-    
+
+    def showEvent(self, event):
+        if not self._styled:
+            self._styled = True
+            self._apply_card_style()
+        super().showEvent(event)
+
     def paintEvent(self, event):
         """Custom paint for chamfered corners if needed"""
         super().paintEvent(event)
@@ -148,206 +199,365 @@ class HUDStatsWidget(QWidget):
         self.value_label.setText(str(value))
 
 
+class SignalBarsWidget(QWidget):
+    """
+    Signal-strength bars drawn in a single paintEvent
+
+    Replaces the eight QFrame children each tag card used for its
+    bars: one widget and one QPainter session of fillRect calls
+    instead of eight widget allocations, style resolutions and paint
+    passes per card.
+    """
+
+    BAR_COUNT = 8
+    BAR_WIDTH = 8
+    BAR_SPACING = 2
+
+    def __init__(self, active: int = 5, parent=None):
+        super().__init__(parent)
+        self._active = active
+        width = self.BAR_COUNT * (self.BAR_WIDTH + self.BAR_SPACING) - self.BAR_SPACING
+        self.setFixedSize(width, 4 + (self.BAR_COUNT - 1) * 2)
+
+    def set_active(self, active: int):
+        """Set the number of lit bars"""
+        if active != self._active:
+            self._active = active
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        h = self.height()
+        active = self._active
+        for i, (x, bar_h) in enumerate(_BAR_GEOMETRY):
+            painter.fillRect(x, h - bar_h, self.BAR_WIDTH, bar_h,
+                             _BAR_ON_COLOR if i < active else _BAR_OFF_COLOR)
+
+
+def _paint_card_chrome(painter, card_rect, antenna, active_bars,
+                       mono_bold, display):
+    """
+    Draw the parts of a card that are identical for every tag with the
+    same antenna and bar count: separator, row labels, ANT value and
+    the signal bars. This is what gets baked into template pixmaps.
+    """
+    rect = card_rect.adjusted(10, 8, -10, -8)
+    x = rect.left()
+    mid = x + rect.width() // 2
+
+    # Separator line under the EPC row
+    sep_y = rect.top() + 20
+    painter.setPen(_SEPARATOR_COLOR)
+    painter.drawLine(x, sep_y, rect.right(), sep_y)
+
+    # Data row labels: ANT/RSSI then CNT/DIR
+    row1_y = sep_y + 18
+    row2_y = row1_y + 16
+    painter.setFont(display)
+    painter.setPen(_DIM_COLOR)
+    painter.drawText(x, row1_y, "ANT:")
+    painter.drawText(mid, row1_y, "RSSI:")
+    painter.drawText(x, row2_y, "CNT:")
+    painter.drawText(mid, row2_y, "DIR:")
+
+    painter.setFont(mono_bold)
+    painter.setPen(_VALUE_COLOR)
+    painter.drawText(x + 38, row1_y, str(antenna))
+
+    # Signal strength bars along the bottom edge
+    bottom = rect.bottom()
+    for i, (bar_x, bar_h) in enumerate(_BAR_GEOMETRY):
+        painter.fillRect(x + bar_x, bottom - bar_h, 8, bar_h,
+                         _BAR_ON_COLOR if i < active_bars else _BAR_OFF_COLOR)
+
+
+def _paint_card_text(painter, card_rect, tag_data, mono_bold, display):
+    """Draw the per-tag values (EPC, CNT, RSSI, DIR) over the chrome"""
+    rect = card_rect.adjusted(10, 8, -10, -8)
+    x = rect.left()
+    mid = x + rect.width() // 2
+
+    # EPC, elided to the card width
+    painter.setFont(mono_bold)
+    painter.setPen(_EPC_COLOR)
+    painter.drawText(x, rect.top() + 12,
+                     _elided_epc(tag_data.get('epc', 'UNKNOWN')))
+
+    row1_y = rect.top() + 38
+    row2_y = row1_y + 16
+    painter.setPen(_VALUE_COLOR)
+    painter.drawText(x + 38, row2_y, str(tag_data.get('count', '-')))
+    painter.setPen(_SUCCESS_COLOR)
+    painter.drawText(mid + 42, row1_y, str(tag_data.get('rssi', '-')))
+    painter.setPen(_SECONDARY_COLOR)
+    # Using rssi field for direction
+    painter.drawText(mid + 42, row2_y, str(tag_data.get('rssi', '-')))
+
+
+def _paint_card_content(painter, card_rect, tag_data, mono_bold, display,
+                        active_bars=5):
+    """
+    Draw one tag card's content with QPainter
+
+    Shared by TagCardWidget.paintEvent and TagCardDelegate.paint so
+    the widget and the view-based grid render identically.
+    """
+    _paint_card_chrome(painter, card_rect, tag_data.get('antenna', '-'),
+                       active_bars, mono_bold, display)
+    _paint_card_text(painter, card_rect, tag_data, mono_bold, display)
+
+
 class TagCardWidget(QFrame):
     """
-    Individual tag data card for grid view
-    Displays tag information with visual signal indicator
-    
-    Features:
-    - Glowing border effect
-    - Signal strength visualization (fake bars/graph)
-    - Monospaced data display
-    - Compact layout optimized for grid
+    Individual tag data card for grid view, drawn in one paintEvent
+
+    A card used to be ~20 QObjects (nine labels, a separator frame,
+    signal bars, nested layouts); on PyQt6 that per-object overhead
+    dominated grid population. The card is now a single widget whose
+    paintEvent draws the EPC line, separator, ANT/RSSI/CNT/DIR rows
+    and signal bars directly with QPainter - the frame border and
+    background still come from the theme's tagCard rule.
     """
-    
+
+    ACTIVE_BARS = 5
+
     def __init__(self, tag_data: dict, parent=None):
         super().__init__(parent)
         self.tag_data = tag_data
-        self._setup_ui()
-    
-    def _setup_ui(self):
-        """Setup tag card UI"""
+
         self.setFixedHeight(120)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        
-        # Glowing border styling
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {HUDColors.BG_PANEL};
-                border: 2px solid {HUDColors.PRIMARY};
-                padding: 8px;
-            }}
-            QFrame:hover {{
-                border-color: {HUDColors.PRIMARY};
-                background-color: {HUDColors.BG_CARD};
-            }}
-        """)
-        
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(10, 8, 10, 8)
-        layout.setSpacing(6)
-        
-        # EPC (truncated if too long)
-        epc = self.tag_data.get('epc', 'UNKNOWN')
-        if len(epc) > 20:
-            epc_display = epc[:18] + "..."
-        else:
-            epc_display = epc
-        
-        epc_label = QLabel(f"EPC: {epc_display}", self)
-        epc_label.setFont(HUDFonts.get_monospace_font(9, bold=True))
-        epc_label.setStyleSheet(f"color: {HUDColors.PRIMARY}; background: transparent; border: none;")
-        layout.addWidget(epc_label)
-        
-        # Separator line
-        line = QFrame(self)
-        line.setFrameShape(QFrame.Shape.HLine)
-        line.setStyleSheet(f"background-color: {HUDColors.BORDER}; border: none; max-height: 1px;")
-        layout.addWidget(line)
-        
-        # Data grid
-        data_grid = QGridLayout()
-        data_grid.setSpacing(4)
-        data_grid.setContentsMargins(0, 0, 0, 0)
-        
-        # Row 1: Antenna / RSSI
-        ant_label = QLabel("ANT:", self)
-        ant_label.setFont(HUDFonts.get_display_font(8))
-        ant_label.setStyleSheet(f"color: {HUDColors.TEXT_DIM}; background: transparent; border: none;")
-        
-        ant_value = QLabel(str(self.tag_data.get('antenna', '-')), self)
-        ant_value.setFont(HUDFonts.get_monospace_font(9, bold=True))
-        ant_value.setStyleSheet(f"color: {HUDColors.TEXT_PRIMARY}; background: transparent; border: none;")
-        
-        rssi_label = QLabel("RSSI:", self)
-        rssi_label.setFont(HUDFonts.get_display_font(8))
-        rssi_label.setStyleSheet(f"color: {HUDColors.TEXT_DIM}; background: transparent; border: none;")
-        
-        rssi_value = QLabel(str(self.tag_data.get('rssi', '-')), self)
-        rssi_value.setFont(HUDFonts.get_monospace_font(9, bold=True))
-        rssi_value.setStyleSheet(f"color: {HUDColors.SUCCESS}; background: transparent; border: none;")
-        
-        data_grid.addWidget(ant_label, 0, 0)
-        data_grid.addWidget(ant_value, 0, 1)
-        data_grid.addWidget(rssi_label, 0, 2)
-        data_grid.addWidget(rssi_value, 0, 3)
-        
-        # Row 2: Count / Direction
-        cnt_label = QLabel("CNT:", self)
-        cnt_label.setFont(HUDFonts.get_display_font(8))
-        cnt_label.setStyleSheet(f"color: {HUDColors.TEXT_DIM}; background: transparent; border: none;")
-        
-        cnt_value = QLabel(str(self.tag_data.get('count', '-')), self)
-        cnt_value.setFont(HUDFonts.get_monospace_font(9, bold=True))
-        cnt_value.setStyleSheet(f"color: {HUDColors.TEXT_PRIMARY}; background: transparent; border: none;")
-        
-        dir_label = QLabel("DIR:", self)
-        dir_label.setFont(HUDFonts.get_display_font(8))
-        dir_label.setStyleSheet(f"color: {HUDColors.TEXT_DIM}; background: transparent; border: none;")
-        
-        dir_value = QLabel(str(self.tag_data.get('rssi', '-')), self)  # Using rssi field for direction
-        dir_value.setFont(HUDFonts.get_monospace_font(9, bold=True))
-        dir_value.setStyleSheet(f"color: {HUDColors.SECONDARY}; background: transparent; border: none;")
-        
-        data_grid.addWidget(cnt_label, 1, 0)
-        data_grid.addWidget(cnt_value, 1, 1)
-        data_grid.addWidget(dir_label, 1, 2)
-        data_grid.addWidget(dir_value, 1, 3)
-        
-        layout.addLayout(data_grid)
-        
-        # Signal strength visualization (simple bars)
-        signal_container = QHBoxLayout()
-        signal_container.setSpacing(2)
-        signal_container.setContentsMargins(0, 4, 0, 0)
-        
-        # Create fake signal bars (3 bars for visual effect)
-        for i in range(8):
-            bar = QFrame(self)
-            bar.setFixedWidth(8)
-            bar.setFixedHeight(4 + i * 2)
-            if i < 5:  # First 5 bars are "active"
-                bar.setStyleSheet(f"background-color: {HUDColors.PRIMARY}; border: none;")
-            else:
-                bar.setStyleSheet(f"background-color: {HUDColors.BORDER_DIM}; border: none;")
-            signal_container.addWidget(bar, alignment=Qt.AlignmentFlag.AlignBottom)
-        
-        signal_container.addStretch()
-        layout.addLayout(signal_container)
+
+        # Background/border from the application theme's hudRole rules
+        # (theme.apply_hud_theme); constructing a card parses no QSS
+        self.setProperty("hudRole", "tagCard")
+
+        # Fonts resolved once per card and reused every paint
+        self._mono_bold = HUDFonts.get_monospace_font(9, bold=True)
+        self._display = HUDFonts.get_display_font(8)
+
+    def sizeHint(self):
+        return QSize(240, 120)
+
+    def rebind(self, tag_data: dict):
+        """
+        Point this card at new tag data without rebuilding anything
+
+        The next paint picks the new values up; this is what makes the
+        grid's recycling pool worthwhile.
+        """
+        self.tag_data = tag_data
+        self.update()
+
+    def paintEvent(self, event):
+        # Let the styled QFrame paint the themed border/background
+        super().paintEvent(event)
+
+        painter = QPainter(self)
+        _paint_card_content(painter, self.rect(), self.tag_data,
+                            self._mono_bold, self._display, self.ACTIVE_BARS)
+
+
+class TagListModel(QAbstractListModel):
+    """Flat list model over tag_data dicts for the delegate-drawn grid"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tags = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tags)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.UserRole and index.isValid():
+            return self._tags[index.row()]
+        return None
+
+    def append_tag(self, tag_data: dict):
+        """Append one tag row"""
+        n = len(self._tags)
+        self.beginInsertRows(QModelIndex(), n, n)
+        self._tags.append(tag_data)
+        self.endInsertRows()
+
+    def append_tags(self, tags: list):
+        """Append a burst of tag rows as a single insert"""
+        if not tags:
+            return
+        n = len(self._tags)
+        self.beginInsertRows(QModelIndex(), n, n + len(tags) - 1)
+        self._tags.extend(tags)
+        self.endInsertRows()
+
+    def update_tag(self, row: int, tag_data: dict):
+        """Replace one row's tag data in place"""
+        self._tags[row] = tag_data
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.UserRole])
+
+    def clear(self):
+        """Drop all rows in one model reset"""
+        self.beginResetModel()
+        self._tags.clear()
+        self.endResetModel()
+
+
+# Rendered card chrome per (antenna, active_bars) - many tags share the
+# same combination, so their background, border, labels and bars are
+# painted once into a pixmap and blitted from then on
+_TEMPLATE_CACHE: dict = {}
+
+
+def _card_template(antenna, active_bars):
+    """Shared chrome pixmap for one (antenna, bars) combination"""
+    key = (antenna, active_bars)
+    pixmap = _TEMPLATE_CACHE.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(TagCardDelegate.CARD_WIDTH, TagCardDelegate.CARD_HEIGHT)
+        pixmap.fill(HUDColors.qcolor(HUDColors.BG_PANEL))
+        painter = QPainter(pixmap)
+        card_rect = pixmap.rect().adjusted(1, 1, -2, -2)
+        painter.setPen(_EPC_COLOR)
+        painter.drawRect(card_rect)
+        _paint_card_chrome(painter, card_rect, antenna, active_bars,
+                           HUDFonts.get_monospace_font(9, bold=True),
+                           HUDFonts.get_display_font(8))
+        painter.end()
+        _TEMPLATE_CACHE[key] = pixmap
+    return pixmap
+
+
+class TagCardDelegate(QStyledItemDelegate):
+    """
+    Paints one tag card per item (same visuals as TagCardWidget)
+
+    The card chrome comes from a cached template pixmap, so painting a
+    card is one blit plus the per-tag text draws.
+    """
+
+    CARD_WIDTH = 240
+    CARD_HEIGHT = 120
+    ACTIVE_BARS = 5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mono_bold = HUDFonts.get_monospace_font(9, bold=True)
+        self._display = HUDFonts.get_display_font(8)
+        self._size = QSize(self.CARD_WIDTH, self.CARD_HEIGHT)
+
+    def sizeHint(self, option, index):
+        return self._size
+
+    def paint(self, painter, option, index):
+        tag_data = index.data(Qt.ItemDataRole.UserRole)
+        if tag_data is None:
+            return
+
+        painter.drawPixmap(
+            option.rect.topLeft(),
+            _card_template(tag_data.get('antenna', '-'), self.ACTIVE_BARS))
+        _paint_card_text(painter, option.rect.adjusted(1, 1, -1, -1),
+                         tag_data, self._mono_bold, self._display)
 
 
 class TagGridView(QWidget):
     """
-    Grid view container for tag cards
-    Automatically arranges TagCardWidgets in a responsive grid
-    
-    Features:
-    - Scrollable container
-    - Configurable column count
-    - Auto-layout management
+    Grid view for tag cards, rendered by a delegate
+
+    A QListView in icon mode over TagListModel: only the visible cards
+    are painted, and there is no per-tag widget lifecycle at all -
+    adding a tag is a model row insert. The add_tag/clear_tags API is
+    unchanged from the widget-per-card implementation it replaces.
     """
-    
+
     def __init__(self, parent=None, columns: int = 3):
         super().__init__(parent)
+        # Kept for API compatibility; icon mode wraps cards to the
+        # viewport width, so the column count follows the window
         self.columns = columns
-        self.tag_widgets = []
+
+        # Coalescing buffer: per-tag add_tag calls within one 16 ms
+        # window become a single model insert (one view update per
+        # burst instead of one per tag)
+        self._pending = []
+        # EPC -> model row, so a re-read tag updates its existing card
+        # instead of growing the grid with duplicates
+        self._row_by_epc = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
         self._setup_ui()
-    
+
     def _setup_ui(self):
-        """Setup scrollable grid container"""
+        """Setup the delegate-backed list view"""
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Scroll area
-        scroll = QScrollArea(self)
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: transparent;
-                border: none;
-            }}
-        """)
-        
-        # Container widget for grid
-        self.container = QWidget()
-        self.grid_layout = QGridLayout(self.container)
-        self.grid_layout.setSpacing(10)
-        self.grid_layout.setContentsMargins(0, 0, 0, 0)
-        self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        scroll.setWidget(self.container)
-        main_layout.addWidget(scroll)
-    
+
+        view = QListView(self)
+        view.setViewMode(QListView.ViewMode.IconMode)
+        view.setMovement(QListView.Movement.Static)
+        view.setResizeMode(QListView.ResizeMode.Adjust)
+        view.setUniformItemSizes(True)
+        # Lay out newly inserted rows in chunks instead of all at once,
+        # so a large burst of tags never blocks the event loop
+        view.setLayoutMode(QListView.LayoutMode.Batched)
+        view.setBatchSize(64)
+        view.setSpacing(10)
+        view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        view.setStyleSheet("QListView { background-color: transparent; border: none; }")
+
+        self._model = TagListModel(self)
+        view.setModel(self._model)
+        view.setItemDelegate(TagCardDelegate(view))
+
+        self.list_view = view
+        main_layout.addWidget(view)
+
     def add_tag(self, tag_data: dict):
-        """Add a tag card to the grid"""
-        card = TagCardWidget(tag_data, self)
-        self.tag_widgets.append(card)
-        
-        # Calculate grid position
-        index = len(self.tag_widgets) - 1
-        row = index // self.columns
-        col = index % self.columns
-        
-        self.grid_layout.addWidget(card, row, col)
-    
+        """Queue a tag card; queued cards land in one model insert"""
+        self._pending.append(tag_data)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def add_tags(self, tags: list):
+        """Add a burst of tag cards in a single model insert"""
+        self._pending.extend(tags)
+        self._flush_pending()
+
+    def _flush_pending(self):
+        """Drain the coalescing buffer into the model"""
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = []
+
+        row_by_epc = self._row_by_epc
+        next_row = self._model.rowCount()
+        inserts = []
+        for tag_data in pending:
+            row = row_by_epc.get(tag_data.get('epc'))
+            if row is not None:
+                self._model.update_tag(row, tag_data)
+            else:
+                row_by_epc[tag_data.get('epc')] = next_row
+                next_row += 1
+                inserts.append(tag_data)
+        if inserts:
+            self._model.append_tags(inserts)
+
     def clear_tags(self):
-        """Remove all tag cards"""
-        for widget in self.tag_widgets:
-            widget.deleteLater()
-        self.tag_widgets.clear()
-    
+        """Remove all tag cards, dropping any queued ones"""
+        self._flush_timer.stop()
+        self._pending.clear()
+        self._row_by_epc.clear()
+        self._model.clear()
+
     def set_columns(self, columns: int):
-        """Update grid column count and re-layout"""
+        """Retained for API compatibility; icon mode wraps by width"""
         self.columns = columns
-        self._relayout()
-    
-    def _relayout(self):
-        """Re-arrange widgets in grid"""
-        for i, widget in enumerate(self.tag_widgets):
-            row = i // self.columns
-            col = i % self.columns
-            self.grid_layout.addWidget(widget, row, col)
 
 
 class HUDButton(QPushButton):
@@ -371,33 +581,10 @@ class HUDButton(QPushButton):
             self.setIcon(icon.icon())
         
         self.setFont(HUDFonts.get_display_font(10, bold=True))
-        
-        # Override global style for enhanced glow effect
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {HUDColors.BG_PANEL};
-                color: {HUDColors.PRIMARY};
-                border: 2px solid {HUDColors.PRIMARY_DIM};
-                padding: 10px 20px;
-                font-weight: bold;
-                text-transform: uppercase;
-                letter-spacing: 2px;
-            }}
-            QPushButton:hover {{
-                background-color: {HUDColors.PRIMARY_DARK};
-                border-color: {HUDColors.PRIMARY};
-                color: {HUDColors.PRIMARY};
-            }}
-            QPushButton:pressed {{
-                background-color: {HUDColors.PRIMARY_DIM};
-                color: {HUDColors.BG_DARK};
-            }}
-            QPushButton:disabled {{
-                background-color: {HUDColors.BG_DARKER};
-                border-color: {HUDColors.BORDER_DIM};
-                color: {HUDColors.TEXT_DISABLED};
-            }}
-        """)
+
+        # Styled by the application theme's hudRole rules
+        # (theme.apply_hud_theme); constructing a button parses no QSS
+        self.setProperty("hudRole", "hudButton")
 
 
 class HUDSeparator(QFrame):
@@ -417,6 +604,29 @@ class HUDSeparator(QFrame):
         self.setStyleSheet(f"background-color: {HUDColors.BORDER};")
 
 
+@functools.lru_cache(maxsize=32)
+def _title_pixmap(title: str) -> QPixmap:
+    """
+    Pre-rendered "◢ TITLE ◣" band for HUDPanel title bars
+
+    Shaping the decorative triangle glyphs is not free; rendering each
+    distinct title once and handing QLabel a pixmap makes repeat
+    panels (and repaints) a plain blit.
+    """
+    font = QFont(HUDFonts.get_display_font(12, bold=True))
+    font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 2)
+    text = f"◢ {title} ◣"
+    metrics = QFontMetrics(font)
+    pixmap = QPixmap(metrics.horizontalAdvance(text) + 4, metrics.height())
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.setPen(HUDColors.qcolor(HUDColors.PRIMARY))
+    painter.drawText(0, metrics.ascent(), text)
+    painter.end()
+    return pixmap
+
+
 class HUDPanel(HUDCard):
     """
     Main content panel with title bar
@@ -449,9 +659,9 @@ class HUDPanel(HUDCard):
         title_layout = QHBoxLayout(title_bar)
         title_layout.setContentsMargins(0, 0, 0, 0)
         
-        title_label = QLabel(f"◢ {self.title} ◣", self)
-        title_label.setFont(HUDFonts.get_display_font(12, bold=True))
-        title_label.setStyleSheet(f"color: {HUDColors.PRIMARY}; letter-spacing: 2px; background: transparent; border: none;")
+        title_label = QLabel(self)
+        title_label.setPixmap(_title_pixmap(self.title))
+        title_label.setStyleSheet("background: transparent; border: none;")
         title_layout.addWidget(title_label)
         title_layout.addStretch()
         
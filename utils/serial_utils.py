@@ -12,14 +12,17 @@ CRITICAL PROTOCOL NOTES (from C# reference implementation):
 RASPBERRY PI / LINUX OPTIMIZATIONS:
 - Auto-detects Linux serial ports (/dev/ttyUSB*, /dev/ttyACM*)
 - Checks for dialout group permissions
-- Increased sleep intervals to reduce CPU usage on ARM
+- Blocking kernel reads instead of sleep-polling to reduce CPU usage on ARM
 - Thread-safe design for smooth GUI operation
 """
 
+import glob
+import re
 import serial
 import serial.tools.list_ports
 from typing import List, Optional, Callable, Tuple
 from dataclasses import dataclass
+import select
 import threading
 import time
 from datetime import datetime
@@ -36,6 +39,14 @@ import platform
 IS_LINUX = sys.platform.startswith('linux')
 IS_RASPBERRY_PI = IS_LINUX and os.path.exists('/proc/device-tree/model')
 
+if IS_LINUX:
+    import fcntl
+    import struct
+    import termios
+
+    # Zeroed argument buffer for TIOCMGET (contents are overwritten)
+    _TIOCM_ARG = struct.pack('I', 0)
+
 # Sleep intervals - CRITICAL for Raspberry Pi CPU optimization!
 # On Pi, tight loops without sleep will consume 100% CPU and freeze the system
 if IS_RASPBERRY_PI or IS_LINUX:
@@ -49,29 +60,108 @@ else:
     SENSOR_POLL_INTERVAL = 0.001  # 1ms
 
 
+@dataclass
+class _SysfsPortInfo:
+    """Minimal stand-in for pyserial's ListPortInfo on the sysfs fast path"""
+    device: str
+    description: str = ''
+    manufacturer: str = ''
+
+
+def _read_sysfs_attr(path: str) -> str:
+    """Read one sysfs attribute file, empty string if unavailable"""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return ''
+
+
+def _scan_ports_sysfs() -> Optional[List[_SysfsPortInfo]]:
+    """
+    Fast Linux port scan straight from /dev and /sys/class/tty
+
+    pyserial's comports() walks /sys and queries udev per entry -
+    tens of ms per call on a Pi. A glob plus direct sysfs attribute
+    reads yields the same device/description/manufacturer fields in
+    tens of microseconds. Returns None when sysfs is not mounted so
+    the caller can fall back to pyserial.
+    """
+    if not os.path.isdir('/sys/class/tty'):
+        return None
+
+    found = []
+    for dev in sorted(glob.glob('/dev/ttyUSB*') + glob.glob('/dev/ttyACM*')):
+        name = os.path.basename(dev)
+        desc = mfg = ''
+        # USB attributes live on an ancestor of the tty's device node
+        node = os.path.realpath(f'/sys/class/tty/{name}/device')
+        for _ in range(4):
+            if os.path.exists(os.path.join(node, 'idVendor')):
+                desc = _read_sysfs_attr(os.path.join(node, 'product'))
+                mfg = _read_sysfs_attr(os.path.join(node, 'manufacturer'))
+                break
+            node = os.path.dirname(node)
+        found.append(_SysfsPortInfo(dev, desc, mfg))
+
+    # Hardware UARTs (Pi GPIO pins); a /device node filters out the
+    # unbound ttyS stubs kernels register in bulk
+    for dev in sorted(glob.glob('/dev/ttyS*')):
+        name = os.path.basename(dev)
+        if os.path.isdir(f'/sys/class/tty/{name}/device'):
+            found.append(_SysfsPortInfo(dev))
+
+    return found
+
+
+# Port scans are triggered by UI refreshes, which can repeat rapidly;
+# a short TTL makes repeat scans free without hiding (un)plug events
+# for more than a second
+_PORT_SCAN_TTL = 1.0
+_port_scan_cache: Tuple[float, Optional[list]] = (0.0, None)
+
+
+def _scan_ports() -> list:
+    """List candidate serial ports (TTL-cached, sysfs fast path on Linux)"""
+    global _port_scan_cache
+    ts, cached = _port_scan_cache
+    now = time.monotonic()
+    if cached is not None and now - ts < _PORT_SCAN_TTL:
+        return cached
+
+    ports = _scan_ports_sysfs() if IS_LINUX else None
+    if ports is None:
+        ports = list(serial.tools.list_ports.comports())
+    _port_scan_cache = (now, ports)
+    return ports
+
+
+# Detection heuristics, compiled once: each candidate string is
+# scanned a single time instead of once per keyword
+_LINUX_PORT_PREFIXES = ('/dev/ttyUSB', '/dev/ttyACM', '/dev/ttyS')
+_DESC_RE = re.compile(r'cp210|ch340|ftdi|pl2303|rfid|reader', re.IGNORECASE)
+_MFG_RE = re.compile(r'silicon labs|ftdi|wch|prolific', re.IGNORECASE)
+
+
 def get_available_ports() -> List[str]:
     """
     Get list of available serial ports
-    
+
     CROSS-PLATFORM:
     - Windows: Returns COM1, COM2, etc.
     - Linux/Pi: Returns /dev/ttyUSB0, /dev/ttyACM0, /dev/ttyS0, etc.
-    
+
     Filters out non-relevant ports on each platform.
     """
-    ports = serial.tools.list_ports.comports()
-    
+    ports = _scan_ports()
+
     if IS_LINUX:
         # On Linux, filter to show only likely RFID reader ports
         # ttyUSB* = USB-to-Serial adapters (most common for RFID readers)
         # ttyACM* = USB CDC devices (Arduino-style readers)
         # ttyS* = Hardware UART (Pi GPIO pins)
-        filtered = []
-        for port in ports:
-            device = port.device
-            if any(x in device for x in ['/dev/ttyUSB', '/dev/ttyACM', '/dev/ttyS']):
-                filtered.append(port)
-        ports = filtered
+        ports = [port for port in ports
+                 if port.device.startswith(_LINUX_PORT_PREFIXES)]
     
     return [port.device for port in sorted(ports, key=lambda p: p.device)]
 
@@ -101,10 +191,17 @@ def check_linux_permissions(port: str) -> Tuple[bool, str]:
     
     try:
         username = pwd.getpwuid(os.getuid()).pw_name
-        user_groups = [g.gr_name for g in grp.getgrall() if username in g.gr_mem]
-        
-        # Check if in dialout group
-        if 'dialout' not in user_groups:
+
+        # Test the process's own credential set - grp.getgrall()
+        # enumerates every group on the system (a full NSS/LDAP walk,
+        # potentially hundreds of ms); one getgrnam lookup plus
+        # os.getgroups() answers the same question directly
+        try:
+            in_dialout = grp.getgrnam('dialout').gr_gid in os.getgroups()
+        except KeyError:
+            in_dialout = False
+
+        if not in_dialout:
             return False, (
                 f"Permission denied for {port}.\n"
                 f"User '{username}' is not in 'dialout' group.\n"
@@ -126,8 +223,8 @@ def detect_rfid_reader_port() -> Optional[str]:
     
     Returns: Port name or None if not found
     """
-    ports = serial.tools.list_ports.comports()
-    
+    ports = _scan_ports()
+
     # Priority order for detection
     candidates = []
     
@@ -142,13 +239,11 @@ def detect_rfid_reader_port() -> Optional[str]:
             score += 5
             
         # Check for common RFID reader chip identifiers
-        desc = (port.description or '').lower()
-        if any(x in desc for x in ['cp210', 'ch340', 'ftdi', 'pl2303', 'rfid', 'reader']):
+        if _DESC_RE.search(port.description or ''):
             score += 15
-        
+
         # Check manufacturer
-        mfg = (port.manufacturer or '').lower()
-        if any(x in mfg for x in ['silicon labs', 'ftdi', 'wch', 'prolific']):
+        if _MFG_RE.search(port.manufacturer or ''):
             score += 10
         
         if score > 0:
@@ -203,6 +298,16 @@ class SerialManager:
         
         self._is_reading = False
         self._read_lock = threading.Lock()
+
+        # Preallocated RX buffer: bursts are read into this via
+        # readinto, saving pyserial's per-read bytearray allocation
+        # on the hot path (only the dispatched bytes are copied out)
+        self._rx_buf = bytearray(4096)
+
+        # When True, an external driver (e.g. a QSocketNotifier on the
+        # Qt event loop) owns data reads; the monitor thread then only
+        # polls the CTS/DSR modem lines
+        self._external_read = False
         
         # Callbacks
         self._on_data_received: Optional[Callable[[bytes], None]] = None
@@ -211,9 +316,16 @@ class SerialManager:
         self._on_dsr_changed: Optional[Callable[[bool, datetime], None]] = None
         self._on_error: Optional[Callable[[str], None]] = None
         
-        # Previous pin states for edge detection
+        # Previous pin states for edge detection, shared between the
+        # polled check and the TIOCMIWAIT thread
         self._prev_cts = False
         self._prev_dsr = False
+        self._edge_lock = threading.Lock()
+
+        # True once TIOCMIWAIT has proven driver support; the monitor
+        # loop then stops polling the modem lines
+        self._modem_thread: Optional[threading.Thread] = None
+        self._modem_wait_active = False
         
         # Platform info for logging
         self._platform_info = f"{'Raspberry Pi' if IS_RASPBERRY_PI else 'Linux' if IS_LINUX else platform.system()}"
@@ -304,6 +416,10 @@ class SerialManager:
             # Clear any stale data in buffers
             self._reader_port.reset_input_buffer()
             self._reader_port.reset_output_buffer()
+
+            # Bound the monitor thread's blocking read so CTS/DSR
+            # edges are still checked ~10x/sec while idle
+            self._reader_port.timeout = 0.1
             
             # Start monitoring thread
             self._is_reading = True
@@ -313,7 +429,19 @@ class SerialManager:
                 name="ReaderMonitor"  # Named thread for debugging
             )
             self._reader_thread.start()
-            
+
+            # Modem-line edges: a dedicated thread sleeps in the kernel
+            # until a line changes; the monitor loop keeps its polled
+            # check until the driver proves TIOCMIWAIT support
+            self._modem_wait_active = False
+            if IS_LINUX:
+                self._modem_thread = threading.Thread(
+                    target=self._modem_wait_loop,
+                    daemon=True,
+                    name="ModemWait"
+                )
+                self._modem_thread.start()
+
             platform_note = f" ({self._platform_info})" if IS_LINUX else ""
             return True, f"Connected to {params.port} @ {params.baudrate} baud{platform_note}"
             
@@ -380,6 +508,40 @@ class SerialManager:
         except Exception as e:
             return False, f"Disconnect error: {str(e)}"
     
+    def reader_fileno(self) -> Optional[int]:
+        """
+        Get the underlying file descriptor of the reader port
+
+        Returns None when the port is closed or the platform/driver
+        does not expose a selectable fd (e.g. Windows).
+        """
+        if self._reader_port and self._reader_port.is_open:
+            try:
+                return self._reader_port.fileno()
+            except (OSError, NotImplementedError):
+                return None
+        return None
+
+    def set_external_read(self, enabled: bool):
+        """
+        Hand data reads over to (or back from) an external driver
+
+        With external reads enabled the monitor thread skips the
+        in_waiting/read polling and only watches CTS/DSR edges.
+        """
+        self._external_read = enabled
+
+    def read_available(self) -> bytes:
+        """Read all bytes currently waiting on the reader port (non-blocking)"""
+        try:
+            if self._reader_port and self._reader_port.is_open:
+                bytes_waiting = self._reader_port.in_waiting
+                if bytes_waiting > 0:
+                    return self._reader_port.read(bytes_waiting)
+        except (OSError, serial.SerialException):
+            pass
+        return b''
+
     def send_command(self, data: bytes) -> bool:
         """
         Send command to reader
@@ -403,55 +565,137 @@ class SerialManager:
                 self._on_error(f"Send error: {str(e)}")
             return False
     
+    def _read_modem_lines(self) -> Tuple[bool, bool]:
+        """
+        Read the (CTS, DSR) pin states
+
+        On Linux both lines come from a single TIOCMGET ioctl - the
+        pyserial cts/dsr properties issue one syscall each, doubling
+        the modem-line polling cost on the monitor thread. Elsewhere
+        (or when the driver has no usable fd) the properties are used.
+        """
+        port = self._reader_port
+        if IS_LINUX:
+            try:
+                buf = fcntl.ioctl(port.fileno(), termios.TIOCMGET, _TIOCM_ARG)
+                bits = struct.unpack('I', buf)[0]
+                return bool(bits & termios.TIOCM_CTS), bool(bits & termios.TIOCM_DSR)
+            except (OSError, NotImplementedError, ValueError):
+                pass
+        return port.cts, port.dsr
+
+    def _dispatch_modem_edges(self, cts: bool, dsr: bool, now: datetime):
+        """Fire rising-edge callbacks against the shared previous state"""
+        with self._edge_lock:
+            fire_cts = cts and not self._prev_cts
+            self._prev_cts = cts
+            fire_dsr = dsr and not self._prev_dsr
+            self._prev_dsr = dsr
+        if fire_cts and self._on_cts_changed:
+            self._on_cts_changed(True, now)
+        if fire_dsr and self._on_dsr_changed:
+            self._on_dsr_changed(True, now)
+
+    def _modem_wait_loop(self):
+        """
+        Dedicated thread sleeping in TIOCMIWAIT until a modem-line edge
+
+        The kernel wakes this thread the moment CTS or DSR changes, so
+        edge latency is scheduler latency instead of the polling
+        cadence, and quiet lines cost zero CPU. Many USB-serial
+        drivers do not implement TIOCMIWAIT - the first failed ioctl
+        returns quietly and edge detection stays with the polled check
+        in the monitor loop. The thread is a daemon and blocks in the
+        kernel, so disconnect does not join it.
+        """
+        try:
+            fd = self._reader_port.fileno()
+        except (OSError, NotImplementedError):
+            return
+        wait_for = struct.pack('I', termios.TIOCM_CTS | termios.TIOCM_DSR)
+
+        while self._is_reading and self._reader_port and self._reader_port.is_open:
+            try:
+                fcntl.ioctl(fd, termios.TIOCMIWAIT, wait_for)
+            except (OSError, ValueError):
+                self._modem_wait_active = False
+                return
+            # First successful wait proves driver support; the monitor
+            # loop stops polling the lines from here on
+            self._modem_wait_active = True
+            try:
+                cts, dsr = self._read_modem_lines()
+            except (OSError, serial.SerialException):
+                continue
+            self._dispatch_modem_edges(cts, dsr, datetime.now())
+
     def _reader_monitor_loop(self):
         """
         Background thread for monitoring reader port
-        
+
         RASPBERRY PI CPU OPTIMIZATION:
-        Uses SERIAL_POLL_INTERVAL (10ms on Pi, 1ms on desktop)
-        Without proper sleep, this loop will consume 100% CPU on Pi
-        and cause system freezes!
-        
-        The 10ms interval still provides ~100 polls/second which is
-        more than enough for RFID communication (tags typically read
-        at 50-200ms intervals).
+        The thread sleeps in the kernel until data arrives - via
+        select.poll() on the tty fd where available, falling back to a
+        bounded blocking read() elsewhere - instead of waking every
+        10ms to poll in_waiting. Idle CPU drops to ~0 and bytes are
+        dispatched the moment they arrive rather than on the next poll
+        tick. The 100ms poll timeout doubles as the CTS/DSR re-check
+        cadence while the line is quiet.
         """
+        # poll() multiplexes data waits and the edge-check cadence in
+        # one syscall; not every platform/driver exposes a pollable fd
+        poller = None
+        if hasattr(select, 'poll'):
+            try:
+                poller = select.poll()
+                poller.register(self._reader_port.fileno(), select.POLLIN)
+            except (OSError, NotImplementedError, ValueError):
+                poller = None
+
         while self._is_reading and self._reader_port and self._reader_port.is_open:
             try:
-                # Check for data - read all available bytes at once
-                bytes_waiting = self._reader_port.in_waiting
-                if bytes_waiting > 0:
-                    # Read all available data in one call (more efficient)
-                    data = self._reader_port.read(bytes_waiting)
+                # Wait for data, then drain the burst in one read
+                # (skipped when a QSocketNotifier owns data reads)
+                if not self._external_read:
+                    if poller is not None:
+                        data = b''
+                        if poller.poll(100):
+                            bytes_waiting = self._reader_port.in_waiting
+                            if bytes_waiting > 0:
+                                # Sized to in_waiting so readinto never
+                                # blocks waiting to fill the buffer
+                                n = min(bytes_waiting, len(self._rx_buf))
+                                with memoryview(self._rx_buf) as mv:
+                                    got = self._reader_port.readinto(mv[:n])
+                                    if got:
+                                        data = bytes(mv[:got])
+                    else:
+                        # No poll(): read(1) blocks until a byte or the
+                        # port timeout, then the rest is drained
+                        data = self._reader_port.read(1)
+                        if data:
+                            bytes_waiting = self._reader_port.in_waiting
+                            if bytes_waiting > 0:
+                                data += self._reader_port.read(bytes_waiting)
                     if data and self._on_data_received:
                         self._on_data_received(data)
-                
-                # Monitor CTS/DSR pins for sensor signals
+                else:
+                    # External driver owns reads; pace the CTS/DSR
+                    # polling instead of spinning
+                    time.sleep(SERIAL_POLL_INTERVAL)
+
+                # Monitor CTS/DSR pins for sensor signals (skipped once
+                # the TIOCMIWAIT thread has taken over edge detection)
                 # Note: Some USB-Serial adapters don't support these pins
-                try:
-                    now = datetime.now()
-                    
-                    cts = self._reader_port.cts
-                    if cts and not self._prev_cts:  # Rising edge
-                        if self._on_cts_changed:
-                            self._on_cts_changed(True, now)
-                    self._prev_cts = cts
-                    
-                    dsr = self._reader_port.dsr
-                    if dsr and not self._prev_dsr:  # Rising edge
-                        if self._on_dsr_changed:
-                            self._on_dsr_changed(True, now)
-                    self._prev_dsr = dsr
-                except (OSError, serial.SerialException):
-                    # Some adapters don't support CTS/DSR - silently ignore
-                    pass
-                
-                # =====================================================
-                # CRITICAL: Sleep to prevent 100% CPU usage on Pi!
-                # SERIAL_POLL_INTERVAL is 10ms on Pi, 1ms on desktop
-                # =====================================================
-                time.sleep(SERIAL_POLL_INTERVAL)
-                
+                if not self._modem_wait_active:
+                    try:
+                        now = datetime.now()
+                        cts, dsr = self._read_modem_lines()
+                        self._dispatch_modem_edges(cts, dsr, now)
+                    except (OSError, serial.SerialException):
+                        # Some adapters don't support CTS/DSR - silently ignore
+                        pass
+
             except serial.SerialException as e:
                 if "disconnected" in str(e).lower() or "device" in str(e).lower():
                     if self._on_error:
@@ -467,23 +711,22 @@ class SerialManager:
     def _sensor_read_loop(self):
         """
         Background thread for reading sensor data
-        
+
         RASPBERRY PI CPU OPTIMIZATION:
-        Uses SENSOR_POLL_INTERVAL to reduce CPU load
+        Blocks in read() (bounded by the port timeout) instead of
+        waking every 10ms to poll in_waiting
         """
         while self._sensor_port and self._sensor_port.is_open:
             try:
-                bytes_waiting = self._sensor_port.in_waiting
-                if bytes_waiting > 0:
-                    data = self._sensor_port.read(bytes_waiting)
-                    if data:
-                        text = data.decode('utf-8', errors='ignore')
-                        if self._on_sensor_data:
-                            self._on_sensor_data(text)
-                
-                # CRITICAL: Sleep to reduce CPU usage on Pi
-                time.sleep(SENSOR_POLL_INTERVAL)
-                
+                data = self._sensor_port.read(1)
+                if data:
+                    bytes_waiting = self._sensor_port.in_waiting
+                    if bytes_waiting > 0:
+                        data += self._sensor_port.read(bytes_waiting)
+                    text = data.decode('utf-8', errors='ignore')
+                    if self._on_sensor_data:
+                        self._on_sensor_data(text)
+
             except serial.SerialException:
                 # Port disconnected
                 break
@@ -513,6 +756,69 @@ class SerialManager:
 # RFID Reader Protocol Implementation
 # ============================================================
 
+class FrameParser:
+    """
+    Incremental frame assembler for the reader byte stream
+
+    Accumulates raw serial bytes and emits complete
+    [0xA0][Length][ReaderID][CMD][Data...][Checksum] frames.
+
+    This is the hottest code path during inventory (runs on the
+    serial thread for every received chunk), so it is kept free
+    of Qt dependencies and uses only C-backed bytearray operations
+    (find / del-slicing). The pure-byte interface also means it
+    could be swapped for a compiled implementation later without
+    touching the controller.
+    """
+
+    FRAME_HEADER = 0xA0
+    MIN_FRAME_SIZE = 5  # header + length + reader_id + cmd + checksum
+
+    __slots__ = ('_buffer',)
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def reset(self):
+        """Discard any partially accumulated frame data"""
+        self._buffer.clear()
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Feed raw bytes from the serial port
+
+        Returns a list of complete frames (possibly empty);
+        incomplete trailing data is kept for the next call.
+        """
+        buf = self._buffer
+        buf.extend(data)
+        frames = []
+
+        while len(buf) >= self.MIN_FRAME_SIZE:
+            # Resync to frame start with a C-level scan
+            if buf[0] != self.FRAME_HEADER:
+                idx = buf.find(self.FRAME_HEADER)
+                if idx < 0:
+                    buf.clear()
+                    break
+                del buf[:idx]
+                if len(buf) < self.MIN_FRAME_SIZE:
+                    break
+
+            # Frame size = length byte + header + checksum
+            end = buf[1] + 2
+            if len(buf) < end:
+                break  # Wait for more data
+
+            # Extract through a memoryview: bytes(buf[:end]) would copy
+            # the slice into a temporary bytearray first, this copies once
+            with memoryview(buf) as mv:
+                frames.append(bytes(mv[:end]))
+            del buf[:end]
+
+        return frames
+
+
 class ReaderProtocol:
     """
     Protocol implementation for RFID reader commands
@@ -18,8 +18,15 @@ Design Philosophy:
 - Glowing effects on interactive elements
 """
 
+import functools
+
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QFont, QFontDatabase
+from PyQt6.QtGui import QColor, QFont, QFontDatabase
+
+
+# Memoized QColor instances - parsing a '#RRGGBB' string on every
+# paint is wasted render-loop work
+_QCOLOR_CACHE: dict = {}
 
 
 class HUDColors:
@@ -69,6 +76,14 @@ class HUDColors:
     GLOW_SECONDARY = "rgba(255, 165, 0, 0.5)"    # Orange glow
     GLOW_SUCCESS = "rgba(0, 255, 136, 0.5)"      # Green glow
 
+    @staticmethod
+    def qcolor(color: str) -> QColor:
+        """Shared memoized QColor for a palette string (do not mutate)"""
+        c = _QCOLOR_CACHE.get(color)
+        if c is None:
+            c = _QCOLOR_CACHE[color] = QColor(color)
+        return c
+
 
 class HUDFonts:
     """
@@ -93,8 +108,17 @@ class HUDFonts:
     ]
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_monospace_font(size: int = 10, bold: bool = False) -> QFont:
-        """Get monospace font for data display (telemetry style)"""
+        """
+        Get monospace font for data display (telemetry style)
+
+        Cached per (size, bold): every tag card and stats widget asks
+        for the same handful of fonts, and each uncached call paid for
+        a QFontDatabase.families() enumeration plus a QFont
+        construction. Callers share the returned instance and must not
+        mutate it.
+        """
         available = QFontDatabase.families()
         
         for font_name in HUDFonts._MONOSPACE_FONTS:
@@ -109,8 +133,14 @@ class HUDFonts:
         return font
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_display_font(size: int = 10, bold: bool = False) -> QFont:
-        """Get display font for headings and UI labels"""
+        """
+        Get display font for headings and UI labels
+
+        Cached per (size, bold) like get_monospace_font; the returned
+        QFont is shared and must not be mutated.
+        """
         available = QFontDatabase.families()
         
         for font_name in HUDFonts._DISPLAY_FONTS:
@@ -579,6 +609,51 @@ def apply_hud_theme(app: QApplication):
     QFrame[frameShape="5"] {{ /* VLine */
         background-color: {HUDColors.BORDER};
     }}
+
+    /* ========================================================== */
+    /* TAG CARD ROLES (see utils.hud_widgets) */
+    /* ========================================================== */
+    /* Resolved once here instead of per-widget setStyleSheet calls: */
+    /* each widget only tags itself with a hudRole property, so      */
+    /* building a card triggers no QSS parsing or re-polish at all.  */
+
+    QFrame[hudRole="tagCard"] {{
+        background-color: {HUDColors.BG_PANEL};
+        border: 2px solid {HUDColors.PRIMARY};
+        padding: 8px;
+    }}
+
+    QFrame[hudRole="tagCard"]:hover {{
+        border-color: {HUDColors.PRIMARY};
+        background-color: {HUDColors.BG_CARD};
+    }}
+
+    QPushButton[hudRole="hudButton"] {{
+        background-color: {HUDColors.BG_PANEL};
+        color: {HUDColors.PRIMARY};
+        border: 2px solid {HUDColors.PRIMARY_DIM};
+        padding: 10px 20px;
+        font-weight: bold;
+        text-transform: uppercase;
+        letter-spacing: 2px;
+    }}
+
+    QPushButton[hudRole="hudButton"]:hover {{
+        background-color: {HUDColors.PRIMARY_DARK};
+        border-color: {HUDColors.PRIMARY};
+        color: {HUDColors.PRIMARY};
+    }}
+
+    QPushButton[hudRole="hudButton"]:pressed {{
+        background-color: {HUDColors.PRIMARY_DIM};
+        color: {HUDColors.BG_DARK};
+    }}
+
+    QPushButton[hudRole="hudButton"]:disabled {{
+        background-color: {HUDColors.BG_DARKER};
+        border-color: {HUDColors.BORDER_DIM};
+        color: {HUDColors.TEXT_DISABLED};
+    }}
     """
     
     # Apply stylesheet to application
@@ -6,12 +6,113 @@ This module provides screen-aware configuration values that adapt
 UI elements based on the detected screen resolution.
 """
 
+import functools
 import os
 import sys
+from dataclasses import dataclass
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QSize
 
 
+@dataclass(frozen=True, slots=True)
+class UIValues:
+    """
+    Precomputed UI values for one screen profile
+
+    Frozen so the three module-level profile objects below can be
+    shared by every widget that consults the config - selecting a
+    profile is a dict lookup, not 25+ attribute assignments. Slotted
+    so each value read in a layout pass is a C-level slot descriptor
+    instead of a dict probe.
+    """
+    # Window sizing
+    window_width: int
+    window_height: int
+    min_width: int
+    min_height: int
+    # Margins & spacing
+    page_margin_h: int
+    page_margin_v: int
+    card_margin: int
+    card_spacing: int
+    layout_spacing: int
+    # Fonts
+    font_page_title: int
+    font_card_title: int
+    font_body: int
+    font_caption: int
+    font_stats_value: int
+    # Component heights (touch-friendly minimum 36px)
+    button_height: int
+    toolbar_height: int
+    stats_card_height: int
+    logo_height: int
+    input_row_height: int
+    # Icon sizes
+    icon_title: int
+    icon_small: int
+    # Navigation bar
+    nav_width_compact: int
+    nav_width_expanded: int
+    # Responsive features
+    use_scroll_area: bool
+    nav_collapsed_default: bool
+    show_logo_in_header: bool
+    table_row_height: int
+
+
+SMALL_PROFILE = UIValues(
+    # 1024x600 (Raspberry Pi 7" touchscreen) - compact everything
+    window_width=1024, window_height=600, min_width=1024, min_height=600,
+    page_margin_h=12, page_margin_v=8, card_margin=10,
+    card_spacing=8, layout_spacing=6,
+    font_page_title=16, font_card_title=12, font_body=9,
+    font_caption=8, font_stats_value=18,
+    button_height=36, toolbar_height=44, stats_card_height=56,
+    logo_height=80, input_row_height=36,
+    icon_title=16, icon_small=14,
+    nav_width_compact=48, nav_width_expanded=160,
+    use_scroll_area=True, nav_collapsed_default=True,
+    show_logo_in_header=True, table_row_height=32,
+)
+
+MEDIUM_PROFILE = UIValues(
+    # 1280x720 - balanced layout
+    window_width=1280, window_height=720, min_width=1024, min_height=600,
+    page_margin_h=24, page_margin_v=12, card_margin=16,
+    card_spacing=12, layout_spacing=10,
+    font_page_title=18, font_card_title=13, font_body=10,
+    font_caption=9, font_stats_value=20,
+    button_height=38, toolbar_height=50, stats_card_height=64,
+    logo_height=100, input_row_height=40,
+    icon_title=24, icon_small=20,
+    nav_width_compact=48, nav_width_expanded=200,
+    use_scroll_area=False, nav_collapsed_default=False,
+    show_logo_in_header=True, table_row_height=40,
+)
+
+LARGE_PROFILE = UIValues(
+    # 1920x1080 - original desktop design
+    window_width=1280, window_height=800, min_width=1024, min_height=700,
+    page_margin_h=36, page_margin_v=16, card_margin=20,
+    card_spacing=16, layout_spacing=12,
+    font_page_title=22, font_card_title=14, font_body=10,
+    font_caption=10, font_stats_value=20,
+    button_height=40, toolbar_height=56, stats_card_height=70,
+    logo_height=120, input_row_height=40,
+    icon_title=24, icon_small=20,
+    nav_width_compact=48, nav_width_expanded=200,
+    use_scroll_area=False, nav_collapsed_default=False,
+    show_logo_in_header=True, table_row_height=40,
+)
+
+_PROFILES = {
+    'small': SMALL_PROFILE,
+    'medium': MEDIUM_PROFILE,
+    'large': LARGE_PROFILE,
+}
+
+
 class UIConfig:
     """
     Responsive UI configuration based on screen size
@@ -25,14 +126,38 @@ class UIConfig:
     # Screen size thresholds
     SMALL_SCREEN_WIDTH = 1024
     MEDIUM_SCREEN_WIDTH = 1280
-    
+
+    # No per-instance __dict__; the detection results live in slots
+    # and everything else is delegated to the shared UIValues object
+    __slots__ = ('profile', 'screen_width', 'screen_height',
+                 'is_raspberry_pi', '_values')
+
     def __init__(self):
         """Initialize configuration based on primary screen size"""
         self._detect_screen_size()
         self._configure_ui_values()
+
+    @classmethod
+    def for_profile(cls, profile: str, width: int, height: int) -> 'UIConfig':
+        """
+        Build a config for a known profile, bypassing screen detection
+
+        Lets the test launchers force a profile directly instead of
+        probing QScreen and then overwriting the result.
+        """
+        self = cls.__new__(cls)
+        self.is_raspberry_pi = is_raspberry_pi()
+        self.screen_width = width
+        self.screen_height = height
+        self.profile = profile
+        self._values = _PROFILES[profile]
+        return self
     
     def _detect_screen_size(self):
         """Detect screen resolution and set profile"""
+        # Cached module-level check (one /proc stat, ever)
+        self.is_raspberry_pi = is_raspberry_pi()
+
         app = QApplication.instance()
         if app is None:
             # Fallback if called before QApplication is created
@@ -54,136 +179,19 @@ class UIConfig:
             self.profile = 'medium'
         else:
             self.profile = 'large'
-        
-        # Raspberry Pi specific detection
-        self.is_raspberry_pi = sys.platform.startswith('linux') and \
-                              os.path.exists('/proc/device-tree/model')
     
     def _configure_ui_values(self):
-        """Set UI values based on screen profile"""
-        
-        # ============================================================
-        # WINDOW SIZING
-        # ============================================================
-        if self.profile == 'small':
-            self.window_width = 1024
-            self.window_height = 600
-            self.min_width = 1024
-            self.min_height = 600
-        elif self.profile == 'medium':
-            self.window_width = 1280
-            self.window_height = 720
-            self.min_width = 1024
-            self.min_height = 600
-        else:  # large
-            self.window_width = 1280
-            self.window_height = 800
-            self.min_width = 1024
-            self.min_height = 700
-        
-        # ============================================================
-        # MARGINS & SPACING
-        # ============================================================
-        if self.profile == 'small':
-            self.page_margin_h = 12  # Horizontal margin (was 36)
-            self.page_margin_v = 8   # Vertical margin (was 16-20)
-            self.card_margin = 10    # Card internal margin (was 20)
-            self.card_spacing = 8    # Space between cards (was 12-20)
-            self.layout_spacing = 6  # General layout spacing (was 12-16)
-        elif self.profile == 'medium':
-            self.page_margin_h = 24
-            self.page_margin_v = 12
-            self.card_margin = 16
-            self.card_spacing = 12
-            self.layout_spacing = 10
-        else:  # large
-            self.page_margin_h = 36
-            self.page_margin_v = 16
-            self.card_margin = 20
-            self.card_spacing = 16
-            self.layout_spacing = 12
-        
-        # ============================================================
-        # FONTS
-        # ============================================================
-        if self.profile == 'small':
-            self.font_page_title = 16      # Was 22-24
-            self.font_card_title = 12      # Was 14
-            self.font_body = 9             # Was 10
-            self.font_caption = 8          # Was 9
-            self.font_stats_value = 18     # Was 20
-        elif self.profile == 'medium':
-            self.font_page_title = 18
-            self.font_card_title = 13
-            self.font_body = 10
-            self.font_caption = 9
-            self.font_stats_value = 20
-        else:  # large
-            self.font_page_title = 22
-            self.font_card_title = 14
-            self.font_body = 10
-            self.font_caption = 10
-            self.font_stats_value = 20
-        
-        # ============================================================
-        # COMPONENT HEIGHTS (Touch-friendly minimum 36px)
-        # ============================================================
-        if self.profile == 'small':
-            self.button_height = 36        # Touch-friendly (was 34-40)
-            self.toolbar_height = 44       # Compact toolbar (was 56)
-            self.stats_card_height = 56    # Compact stats (was 70)
-            self.logo_height = 80          # Bigger logo for visibility
-            self.input_row_height = 36     # Input fields (was 40+)
-        elif self.profile == 'medium':
-            self.button_height = 38
-            self.toolbar_height = 50
-            self.stats_card_height = 64
-            self.logo_height = 100
-            self.input_row_height = 40
-        else:  # large
-            self.button_height = 40
-            self.toolbar_height = 56
-            self.stats_card_height = 70
-            self.logo_height = 120
-            self.input_row_height = 40
-        
-        # ============================================================
-        # ICON SIZES
-        # ============================================================
-        if self.profile == 'small':
-            self.icon_title = 16      # Header icons (was 24)
-            self.icon_small = 14      # Small icons (was 16-20)
-        else:
-            self.icon_title = 24
-            self.icon_small = 20
-        
-        # ============================================================
-        # NAVIGATION BAR
-        # ============================================================
-        if self.profile == 'small':
-            self.nav_width_compact = 48   # Collapsed nav (icons only)
-            self.nav_width_expanded = 160 # Expanded nav (was 200+)
-        else:
-            self.nav_width_compact = 48
-            self.nav_width_expanded = 200
-        
-        # ============================================================
-        # RESPONSIVE FEATURES
-        # ============================================================
-        # Use scroll areas on small screens for pages with lots of content
-        self.use_scroll_area = (self.profile == 'small')
-        
-        # Collapse navigation by default on small screens
-        self.nav_collapsed_default = (self.profile == 'small')
-        
-        # Show logo on all screens including small
-        self.show_logo_in_header = True
-        
-        # Reduce table row heights on small screens
-        if self.profile == 'small':
-            self.table_row_height = 32
-        else:
-            self.table_row_height = 40
+        """Select the shared precomputed value set for the profile"""
+        self._values = _PROFILES[self.profile]
+
+    def __getattr__(self, name):
+        # Reached only when the attribute is not one of the slots
+        # above; delegate to the profile's shared UIValues object.
+        # The _values guard stops recursion if the slot is still
+        # unset mid-construction.
+        if name == '_values':
+            raise AttributeError(name)
+        return getattr(self._values, name)
 
 
 # Singleton instance
@@ -198,19 +206,29 @@ def get_ui_config() -> UIConfig:
     return _config_instance
 
 
-# Convenience function for quick access
+# Convenience functions for quick access - both answers are fixed for
+# the lifetime of the process, so cache them after the first call
+@functools.lru_cache(maxsize=1)
 def is_small_screen() -> bool:
     """Check if running on small screen (1024x600)"""
     return get_ui_config().profile == 'small'
 
 
+@functools.lru_cache(maxsize=1)
 def is_raspberry_pi() -> bool:
     """Check if running on Raspberry Pi"""
-    import os
     return sys.platform.startswith('linux') and \
            os.path.exists('/proc/device-tree/model')
 
 
+# Build the singleton eagerly when the QApplication already exists (the
+# normal path: main.py creates the app before importing the packages
+# that pull this module in), so every later get_ui_config() is a plain
+# global read with the None branch never taken.
+if QApplication.instance() is not None:
+    _config_instance = UIConfig()
+
+
 if __name__ == "__main__":
     # Test configuration
     import os
@@ -584,34 +584,34 @@ class InventoryPage(QWidget):
                 if item:
                     item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
     
-    def add_tag(self, tag: dict):
-        """Add or update a single tag in the table"""
-        epc = tag.get('epc', '')
-        
+    def add_tag(self, tag):
+        """Add or update a single tag (TagEvent) in the table"""
+        epc = tag.epc
+
         # Find existing row
         for row in range(self.inventory_table.rowCount()):
             item = self.inventory_table.item(row, 0)
             if item and item.text() == epc:
                 # Update existing row
-                self.inventory_table.setItem(row, 1, QTableWidgetItem(str(tag.get('antenna', ''))))
-                self.inventory_table.setItem(row, 2, QTableWidgetItem(str(tag.get('count', ''))))
-                self.inventory_table.setItem(row, 3, QTableWidgetItem(str(tag.get('rssi', ''))))
-                self.inventory_table.setItem(row, 4, QTableWidgetItem(str(tag.get('frequency', ''))))
+                self.inventory_table.setItem(row, 1, QTableWidgetItem(str(tag.antenna)))
+                self.inventory_table.setItem(row, 2, QTableWidgetItem(str(tag.count)))
+                self.inventory_table.setItem(row, 3, QTableWidgetItem(str(tag.rssi)))
+                self.inventory_table.setItem(row, 4, QTableWidgetItem(str(tag.frequency)))
                 return
-        
+
         # Add new row
         row = self.inventory_table.rowCount()
         self.inventory_table.insertRow(row)
         self.inventory_table.setItem(row, 0, QTableWidgetItem(epc))
-        self.inventory_table.setItem(row, 1, QTableWidgetItem(str(tag.get('antenna', ''))))
-        self.inventory_table.setItem(row, 2, QTableWidgetItem(str(tag.get('count', ''))))
-        self.inventory_table.setItem(row, 3, QTableWidgetItem(str(tag.get('rssi', ''))))
-        self.inventory_table.setItem(row, 4, QTableWidgetItem(str(tag.get('frequency', ''))))
+        self.inventory_table.setItem(row, 1, QTableWidgetItem(str(tag.antenna)))
+        self.inventory_table.setItem(row, 2, QTableWidgetItem(str(tag.count)))
+        self.inventory_table.setItem(row, 3, QTableWidgetItem(str(tag.rssi)))
+        self.inventory_table.setItem(row, 4, QTableWidgetItem(str(tag.frequency)))
     
     def add_tags_batch(self, tags: list):
         """
-        Add or update multiple tags in a single batch operation
-        
+        Add or update multiple tags (TagEvents) in a single batch operation
+
         RASPBERRY PI OPTIMIZATION:
         - Disables table updates during batch processing
         - Builds an index of existing EPCs for O(1) lookup
@@ -620,10 +620,10 @@ class InventoryPage(QWidget):
         """
         if not tags:
             return
-        
+
         # Disable updates during batch operation for better performance
         self.inventory_table.setUpdatesEnabled(False)
-        
+
         try:
             # Build index of existing EPCs -> row numbers for fast lookup
             # This converts O(n*m) to O(n+m) where n=tags, m=rows
@@ -632,32 +632,29 @@ class InventoryPage(QWidget):
                 item = self.inventory_table.item(row, 0)
                 if item:
                     epc_to_row[item.text()] = row
-            
+
             # Process all tags
             for tag in tags:
-                epc = tag.get('epc', '')
+                epc = tag.epc
                 if not epc:
                     continue
-                
+
                 if epc in epc_to_row:
                     # Update existing row
                     row = epc_to_row[epc]
-                    self.inventory_table.setItem(row, 1, QTableWidgetItem(str(tag.get('antenna', ''))))
-                    self.inventory_table.setItem(row, 2, QTableWidgetItem(str(tag.get('count', ''))))
-                    self.inventory_table.setItem(row, 3, QTableWidgetItem(str(tag.get('rssi', ''))))
-                    self.inventory_table.setItem(row, 4, QTableWidgetItem(str(tag.get('frequency', ''))))
                 else:
                     # Add new row
                     row = self.inventory_table.rowCount()
                     self.inventory_table.insertRow(row)
                     self.inventory_table.setItem(row, 0, QTableWidgetItem(epc))
-                    self.inventory_table.setItem(row, 1, QTableWidgetItem(str(tag.get('antenna', ''))))
-                    self.inventory_table.setItem(row, 2, QTableWidgetItem(str(tag.get('count', ''))))
-                    self.inventory_table.setItem(row, 3, QTableWidgetItem(str(tag.get('rssi', ''))))
-                    self.inventory_table.setItem(row, 4, QTableWidgetItem(str(tag.get('frequency', ''))))
                     # Update index
                     epc_to_row[epc] = row
-        
+
+                self.inventory_table.setItem(row, 1, QTableWidgetItem(str(tag.antenna)))
+                self.inventory_table.setItem(row, 2, QTableWidgetItem(str(tag.count)))
+                self.inventory_table.setItem(row, 3, QTableWidgetItem(str(tag.rssi)))
+                self.inventory_table.setItem(row, 4, QTableWidgetItem(str(tag.frequency)))
+
         finally:
             # Re-enable updates and trigger a single repaint
             self.inventory_table.setUpdatesEnabled(True)
@@ -245,6 +245,11 @@ class MainWindow(FluentWindow):
     def append_log(self, message: str, log_type: int = 0):
         """Append message to log"""
         self.connection_page.append_log(message, log_type)
+
+    def append_logs(self, entries: list):
+        """Append a batch of (message, log_type) entries to the log"""
+        for message, log_type in entries:
+            self.connection_page.append_log(message, log_type)
     
     def update_tag_list(self, tags: list):
         """Update the inventory tag list"""